@@ -20,53 +20,26 @@ from functools import partial
 
 import asyncio
 
-import os, sys, threading, signal, re, subprocess, logging, logging.handlers, argparse
+import os, sys, threading, signal, re, subprocess, logging, logging.handlers, argparse, mmap, selectors
 import trio
 import urllib.request
-from time import time, sleep, strftime, localtime
+from time import time, sleep, strftime, localtime, monotonic
 from datetime import timedelta, datetime
 from _thread import interrupt_main
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from array import array
+from bisect import bisect_left
+from heapq import nlargest, nsmallest
+from concurrent.futures import Future, wait
+from queue import Queue
+from codecs import getincrementaldecoder
 from select import select
 from distutils.util import strtobool
 from string import Template
 from math import ceil, floor
 from random import randint
 from shutil import which
-from typing import List, Set, Dict, Tuple, Optional, Union, Any, Callable, ContextManager, Iterable, Type, NamedTuple
-
-
-reporter = logging.getLogger("reporter")
-reporter.setLevel(level=logging.INFO)
-file_handler = logging.FileHandler("stats.csv")
-reporter.addHandler(file_handler)
-reporter.info("Timestamp - UTC,Event,CPU,used,free,available,total,other")
-
-
-def report(
-    event=None,
-	cpu_usage=None,
-    free=None,
-    total=None,
-    available=None,
-    used=None,
-    **kwargs,
-):
-    def format_optional(thing):
-        if thing is None:
-            return ""
-        else:
-            return thing
-
-    message = (
-        f"{str(datetime.utcnow())},{format_optional(event)},"
-		f"{format_optional(cpu_usage)},"
-        f"{format_optional(used)},{format_optional(free)},"
-        f"{format_optional(available)},{format_optional(total)},"
-        f"{format_optional(kwargs)}"
-    )
-    reporter.info(message)
-
+from typing import List, Set, Dict, Tuple, Optional, Union, Any, Callable, ContextManager, Iterable, Iterator, Type, NamedTuple, Deque, FrozenSet
 
 
 errors: List[str] = []
@@ -103,6 +76,7 @@ args.add_argument("-p" , "--proc"		,action="store_true" ,help ="Start in minimal
 args.add_argument("-s" , "--stat"		,action="store_true" ,help ="Start in minimal mode without process box")
 args.add_argument("-v" , "--version"	,action="store_true" ,help ="Show version info and exit")
 args.add_argument("--debug"				,action="store_true" ,help ="Start with loglevel set to DEBUG overriding value set in config")
+args.add_argument("--headless"			,action="store_true" ,help ="Run the collectors without a terminal, samples are only written to the stats export")
 stdargs = args.parse_args()
 
 if stdargs.version:
@@ -124,6 +98,8 @@ if stdargs.debug:
 else:
 	DEBUG = False
 
+HEADLESS: bool = stdargs.headless
+
 #? Variables ------------------------------------------------------------------------------------->
 
 BANNER_SRC: List[Tuple[str, str, str]] = [
@@ -151,6 +127,18 @@ view_mode=$view_mode
 #* Update time in milliseconds, increases automatically if set below internal loops processing time, recommended 2000 ms or above for better sample times for graphs.
 update_ms=$update_ms
 
+#* Separate update times in milliseconds for the cpu, process, network and disk collectors, 0 to follow update_ms.
+#* Each collector runs on its own deadline, i.e. cpu_update_ms=500 and proc_update_ms=5000 samples cpu often while keeping the expensive process scan rare.
+#* Memory is collected together with disks, at the shortest of update_ms and disk_update_ms.
+cpu_update_ms=$cpu_update_ms
+proc_update_ms=$proc_update_ms
+net_update_ms=$net_update_ms
+disk_update_ms=$disk_update_ms
+
+#* Run the cpu, memory, network and process collectors concurrently in a small thread pool instead of one after another.
+#* Drawing still happens in order after all collectors have finished, recommended for hosts with many processes or slow mounts.
+parallel_collect=$parallel_collect
+
 #* Processes sorting, "pid" "program" "arguments" "threads" "user" "memory" "cpu lazy" "cpu responsive",
 #* "cpu lazy" updates top process over time, "cpu responsive" updates top process directly.
 proc_sorting="$proc_sorting"
@@ -188,6 +176,9 @@ draw_clock="$draw_clock"
 #* Update main ui in background when menus are showing, set this to false if the menus is flickering too much for comfort.
 background_update=$background_update
 
+#* Only print the characters that changed since last update, lowers output a lot over slow connections like ssh at the cost of some cpu time.
+diff_render=$diff_render
+
 #* Custom cpu model name, empty string to disable.
 custom_cpu_name="$custom_cpu_name"
 
@@ -232,6 +223,10 @@ update_check=$update_check
 #* Set loglevel for "~/.config/bpytop/error.log" levels are: "ERROR" "WARNING" "INFO" "DEBUG".
 #* The level set includes all lower levels, i.e. "DEBUG" will show all logging info.
 log_level=$log_level
+
+#* Format for exported collector stats, "csv" for text rows in "stats.csv" or "columnar" for fixed width binary columns in the "stats" directory.
+#* The columnar files are append only and can be memory mapped, use the StatsColumnReader class in bpytop.py to read time ranges.
+stats_format=$stats_format
 ''')
 
 CONFIG_DIR: str = f'{os.path.expanduser("~")}/.config/bpytop'
@@ -392,6 +387,278 @@ def timeit_decorator(func):
 		return out
 	return timed
 
+#? Stats export ---------------------------------------------------------------------------------->
+
+class StatsCsvWriter:
+	'''Appends stats rows as text lines to a csv file'''
+	header: str = "Timestamp - UTC,Event,CPU,used,free,available,total,other"
+	fields: Tuple[str, ...] = ("cpu_usage", "used", "free", "available", "total")
+
+	def __init__(self, path: str):
+		self.path = path
+		self.file = open(path, "a")
+		self.file.write(f'{self.header}\n')
+
+	def write(self, rows: List[Tuple[int, str, Dict[str, Any]]]):
+		lines: List[str] = []
+		for timestamp, event, values in rows:
+			other: Dict[str, Any] = { k : v for k, v in values.items() if k not in self.fields }
+			lines.append(",".join([str(datetime.utcfromtimestamp(timestamp / 1e9)), event] + [f'{"" if values.get(k) is None else values[k]}' for k in self.fields] + [f'{other}']))
+		self.file.write("\n".join(lines) + "\n")
+		self.file.flush()
+
+	def close(self):
+		self.file.close()
+
+class StatsColumnWriter:
+	'''Appends stats rows to a fixed schema columnar store, one directory per event and one raw array file per column
+	* <path>/<event>/time.q holds the time index as int64 nanoseconds since epoch, always sorted,
+	  a timestamp lower than the last one written to the table, after the wall clock was set back, is stored as the last one
+	* <path>/<event>/<column>.<typecode> holds the values, "q" int64 or "d" float64, one value per time index entry
+	* Lists or tuples are split in to columns named <name>.1, <name>.2 ..., "/" in names is replaced with "_"
+	* Missing values are stored as 0 or NaN, columns appearing later are padded for earlier rows
+	* A "q" column is promoted to "d" the first time a float is written to it, so values are never truncated
+	* All files are append only, except for a promoted column being rewritten once, and can be memory mapped, see StatsColumnReader
+	* Column files are kept open between writes and flushed after each write
+	'''
+	fill: Dict[str, Union[int, float]] = { "q" : 0, "d" : float("nan") }
+
+	def __init__(self, path: str):
+		self.path = path
+		self.tables: Dict[str, Dict[str, str]] = {}
+		self.rows: Dict[str, int] = {}
+		self.last: Dict[str, int] = {}
+		self.files: Dict[str, Any] = {}
+		os.makedirs(path, exist_ok=True)
+
+	def _file(self, file: str):
+		if file not in self.files:
+			self.files[file] = open(file, "ab")
+		return self.files[file]
+
+	def _promote(self, table: str, name: str):
+		'''Rewrite an int64 column as float64, the new file is complete before the old one is removed'''
+		values: array = array("q")
+		old: str = f'{table}/{name}.q'
+		if old in self.files: self.files.pop(old).close()
+		with open(old, "rb") as cf:
+			values.frombytes(cf.read())
+		with open(f'{table}/{name}.d', "wb") as cf:
+			array("d", values).tofile(cf)
+		os.remove(old)
+
+	@staticmethod
+	def _flatten(values: Dict[str, Any]) -> Dict[str, Union[int, float]]:
+		out: Dict[str, Union[int, float]] = {}
+		for name, value in values.items():
+			if isinstance(value, (list, tuple)):
+				for n, v in enumerate(value, start=1):
+					if isinstance(v, (int, float)): out[f'{name.replace("/", "_")}.{n}'] = v
+			elif isinstance(value, (int, float)):
+				out[name.replace("/", "_")] = value
+		return out
+
+	def _load(self, event: str):
+		'''Read the schema of an existing table and repair column lengths after an unclean exit'''
+		table: str = f'{self.path}/{event}'
+		os.makedirs(table, exist_ok=True)
+		columns: Dict[str, str] = {}
+		rows: int = os.path.getsize(f'{table}/time.q') // 8 if os.path.isfile(f'{table}/time.q') else 0
+		if rows: os.truncate(f'{table}/time.q', rows * 8) #* Drop any partially written timestamp
+		for f in sorted(os.listdir(table), key=lambda f: f.endswith(".q")):
+			name, _, code = f.rpartition(".")
+			if name == "time" or code not in self.fill: continue
+			if name in columns: #* Exit during a promotion, the "d" file is complete
+				os.remove(f'{table}/{f}')
+				continue
+			columns[name] = code
+			size: int = array(code).itemsize
+			length: int = os.path.getsize(f'{table}/{f}') // size
+			if length > rows:
+				os.truncate(f'{table}/{f}', rows * size)
+			elif length < rows:
+				with open(f'{table}/{f}', "ab") as cf:
+					array(code, [self.fill[code]] * (rows - length)).tofile(cf)
+		self.tables[event] = columns
+		self.rows[event] = rows
+		self.last[event] = 0
+		if rows:
+			times: array = array("q")
+			with open(f'{table}/time.q', "rb") as cf:
+				cf.seek((rows - 1) * 8)
+				times.frombytes(cf.read(8))
+			self.last[event] = times[0]
+
+	def write(self, rows: List[Tuple[int, str, Dict[str, Any]]]):
+		events: Dict[str, List[Tuple[int, Dict[str, Union[int, float]]]]] = {}
+		for timestamp, event, values in rows:
+			events.setdefault(event or "other", []).append((timestamp, self._flatten(values)))
+		for event, event_rows in events.items():
+			if event not in self.tables: self._load(event)
+			table: str = f'{self.path}/{event}'
+			columns = self.tables[event]
+			for _, values in event_rows:
+				for name, value in values.items():
+					if name in columns:
+						if columns[name] == "q" and isinstance(value, float):
+							self._promote(table, name)
+							columns[name] = "d"
+						continue
+					code = "d" if isinstance(value, float) else "q"
+					columns[name] = code
+					array(code, [self.fill[code]] * self.rows[event]).tofile(self._file(f'{table}/{name}.{code}'))
+			for name, code in columns.items():
+				cf = self._file(f'{table}/{name}.{code}')
+				array(code, [values.get(name, self.fill[code]) if code == "d" else values.get(name, 0) for _, values in event_rows]).tofile(cf)
+				cf.flush()
+			times: array = array("q")
+			for timestamp, _ in event_rows:
+				self.last[event] = max(timestamp, self.last[event])
+				times.append(self.last[event])
+			cf = self._file(f'{table}/time.q')
+			times.tofile(cf)
+			cf.flush()
+			self.rows[event] += len(event_rows)
+
+	def close(self):
+		for cf in self.files.values():
+			cf.close()
+		self.files = {}
+
+class StatsColumnReader:
+	'''Memory mapped reader for a store written by StatsColumnWriter
+	* .tables() : List of event tables
+	* .columns(table) : List of column names in table
+	* .slice(table, start, end, columns) : Dict of column name to zero copy memoryview with all values where start <= time < end, times in seconds since epoch
+	* .close() : Release all memory maps not still referenced by views returned from .slice()
+	'''
+	def __init__(self, path: str):
+		self.path = path
+		self.maps: Dict[str, Tuple[mmap.mmap, memoryview]] = {}
+
+	def tables(self) -> List[str]:
+		return sorted(d for d in os.listdir(self.path) if os.path.isfile(f'{self.path}/{d}/time.q'))
+
+	def columns(self, table: str) -> List[str]:
+		return sorted(f.rpartition(".")[0] for f in os.listdir(f'{self.path}/{table}') if f.rpartition(".")[2] in StatsColumnWriter.fill and f != "time.q")
+
+	def _view(self, file: str) -> memoryview:
+		code: str = file.rpartition(".")[2]
+		if file not in self.maps:
+			with open(file, "rb") as f:
+				size: int = os.fstat(f.fileno()).st_size
+				if size < array(code).itemsize: return memoryview(array(code))
+				m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+			self.maps[file] = (m, memoryview(m)[:size - size % array(code).itemsize].cast(code)) #* Skip any partially written value at the end
+		return self.maps[file][1]
+
+	def slice(self, table: str, start: float = 0, end: float = float("inf"), columns: Optional[Iterable[str]] = None) -> Dict[str, memoryview]:
+		times: memoryview = self._view(f'{self.path}/{table}/time.q')
+		first: int = bisect_left(times, int(start * 1e9)) # type: ignore
+		last: int = len(times) if end == float("inf") else bisect_left(times, int(end * 1e9)) # type: ignore
+		codes: Dict[str, str] = { f.rpartition(".")[0] : f.rpartition(".")[2] for f in sorted(os.listdir(f'{self.path}/{table}'), key=lambda f: f.endswith(".d")) } #* Prefer "d" during a promotion
+		out: Dict[str, memoryview] = { "time" : times[first:last] }
+		for name in (columns if columns is not None else self.columns(table)):
+			out[name] = self._view(f'{self.path}/{table}/{name}.{codes[name]}')[first:last]
+		return out
+
+	def close(self):
+		for m, view in self.maps.values():
+			view.release()
+			try:
+				m.close()
+			except BufferError: #* Slices still in use, map is closed when the last one is garbage collected
+				pass
+		self.maps = {}
+
+class Stats:
+	'''Buffered exporter for the collector stats
+	* .report(event, **values) : Queue a row in the in-memory ring buffer, never blocks on disk io
+	* .start() : Start the background flusher in a daemon thread, never keeping the program alive at exit
+	* .stop() : Flush all remaining rows and stop the flusher thread, gives up after .stop_timeout seconds if the writer is blocked
+	* Rows are written in batches when .flush_size rows are queued or every .flush_interval seconds
+	* CONFIG.stats_format selects the writer: "csv" to "stats.csv" or "columnar" to the "stats" directory
+	'''
+	files: Dict[str, str] = { "csv" : "stats.csv", "columnar" : "stats" }
+	writers: Dict[str, Callable] = { "csv" : StatsCsvWriter, "columnar" : StatsColumnWriter }
+	writer: Union[StatsCsvWriter, StatsColumnWriter, None] = None
+	writer_format: str = ""
+	buffer: Deque[Tuple[int, str, Dict[str, Any]]] = deque(maxlen=4096)
+	flush_size: int = 64
+	flush_interval: float = 5.0
+	stop_timeout: float = 5.0
+	dropped: int = 0
+	write_error: bool = False
+	stopping: bool = False
+	started: bool = False
+	flush_now = threading.Event()
+	thread: threading.Thread
+
+	@classmethod
+	def start(cls):
+		cls.stopping = False
+		cls.thread = threading.Thread(target=cls._flusher, name="stats", daemon=True)
+		cls.thread.start()
+		cls.started = True
+
+	@classmethod
+	def stop(cls):
+		if cls.started and cls.thread.is_alive():
+			cls.stopping = True
+			cls.flush_now.set()
+			try:
+				cls.thread.join(timeout=cls.stop_timeout)
+			except:
+				pass
+			if cls.thread.is_alive():
+				errlog.warning(f'Stats flusher still writing after {cls.stop_timeout}s, final flush abandoned with {len(cls.buffer)} rows queued')
+		cls.started = False
+
+	@classmethod
+	def report(cls, event: str = "", **values):
+		'''Queue one row for the flusher thread, oldest rows are dropped if the ring buffer is full'''
+		if len(cls.buffer) == cls.buffer.maxlen: cls.dropped += 1
+		cls.buffer.append((int(time() * 1000000000), event, values))
+		if len(cls.buffer) >= cls.flush_size: cls.flush_now.set()
+
+	@classmethod
+	def _flush(cls):
+		rows: List[Tuple[int, str, Dict[str, Any]]] = []
+		while cls.buffer:
+			rows.append(cls.buffer.popleft())
+		if not rows: return
+		try:
+			if cls.writer_format != CONFIG.stats_format:
+				if cls.writer: cls.writer.close()
+				cls.writer_format = CONFIG.stats_format
+				cls.writer = cls.writers[cls.writer_format](cls.files[cls.writer_format])
+			cls.writer.write(rows) # type: ignore
+		except Exception as e:
+			if not cls.write_error:
+				cls.write_error = True
+				errlog.exception(f'Failed writing stats to "{cls.files.get(CONFIG.stats_format)}": {e}')
+
+	@classmethod
+	def _flusher(cls):
+		'''Write queued rows in batches, meant to be run in it's own thread'''
+		try:
+			while not cls.stopping:
+				cls.flush_now.wait(cls.flush_interval)
+				cls.flush_now.clear()
+				cls._flush()
+			cls._flush()
+			if cls.writer: cls.writer.close()
+		except Exception as e:
+			errlog.exception(f'Stats flusher thread failed with exception: {e}')
+		cls.writer = None
+		cls.writer_format = ""
+		if cls.dropped:
+			errlog.warning(f'Stats buffer overflowed, {cls.dropped} rows were dropped')
+
+def report(event: str = "", cpu_usage=None, free=None, total=None, available=None, used=None, **kwargs):
+	'''Export one row of stats, see Stats class'''
+	Stats.report(event, cpu_usage=cpu_usage, used=used, free=free, available=available, total=total, **kwargs)
+
 #? Set up config class and load config ----------------------------------------------------------->
 
 class Config:
@@ -399,11 +666,17 @@ class Config:
 	keys: List[str] = ["color_theme", "update_ms", "proc_sorting", "proc_reversed", "proc_tree", "check_temp", "draw_clock", "background_update", "custom_cpu_name",
 						"proc_colors", "proc_gradient", "proc_per_core", "proc_mem_bytes", "disks_filter", "update_check", "log_level", "mem_graphs", "show_swap",
 						"swap_disk", "show_disks", "net_download", "net_upload", "net_auto", "net_color_fixed", "show_init", "view_mode", "theme_background",
-						"net_sync", "show_battery", "tree_depth", "cpu_sensor"]
+						"net_sync", "show_battery", "tree_depth", "cpu_sensor", "parallel_collect", "stats_format",
+						"cpu_update_ms", "proc_update_ms", "net_update_ms", "disk_update_ms", "diff_render"]
 	conf_dict: Dict[str, Union[str, int, bool]] = {}
 	color_theme: str = "Default"
 	theme_background: bool = True
 	update_ms: int = 2000
+	cpu_update_ms: int = 0
+	proc_update_ms: int = 0
+	net_update_ms: int = 0
+	disk_update_ms: int = 0
+	parallel_collect: bool = False
 	proc_sorting: str = "cpu lazy"
 	proc_reversed: bool = False
 	proc_tree: bool = False
@@ -416,6 +689,7 @@ class Config:
 	cpu_sensor: str = "Auto"
 	draw_clock: str = "%X"
 	background_update: bool = True
+	diff_render: bool = False
 	custom_cpu_name: str = ""
 	disks_filter: str = ""
 	update_check: bool = True
@@ -432,6 +706,7 @@ class Config:
 	show_init: bool = True
 	view_mode: str = "full"
 	log_level: str = "WARNING"
+	stats_format: str = "csv"
 
 	warnings: List[str] = []
 	info: List[str] = []
@@ -441,6 +716,8 @@ class Config:
 
 	view_modes: List[str] = ["full", "proc", "stat"]
 
+	stats_formats: List[str] = ["csv", "columnar"]
+
 	cpu_sensors: List[str] = [ "Auto" ]
 
 	if hasattr(psutil, "sensors_temperatures"):
@@ -528,9 +805,16 @@ class Config:
 		if "view_mode" in new_config and not new_config["view_mode"] in self.view_modes:
 			new_config["view_mode"] = "_error_"
 			self.warnings.append(f'Config key "view_mode" didn\'t get an acceptable value!')
+		if "stats_format" in new_config and not new_config["stats_format"] in self.stats_formats:
+			new_config["stats_format"] = "_error_"
+			self.warnings.append(f'Config key "stats_format" didn\'t get an acceptable value!')
 		if isinstance(new_config["update_ms"], int) and new_config["update_ms"] < 100:
 			new_config["update_ms"] = 100
 			self.warnings.append(f'Config key "update_ms" can\'t be lower than 100!')
+		for interval_key in ["cpu_update_ms", "proc_update_ms", "net_update_ms", "disk_update_ms"]:
+			if isinstance(new_config.get(interval_key), int) and 0 < new_config[interval_key] < 100:
+				new_config[interval_key] = 100
+				self.warnings.append(f'Config key "{interval_key}" can\'t be lower than 100 unless set to 0!')
 		for net_name in ["net_download", "net_upload"]:
 			if net_name in new_config and not new_config[net_name][0].isdigit(): # type: ignore
 				new_config[net_name] = "_error_"
@@ -630,7 +914,7 @@ class Term:
 				cls.winch.clear()
 			cls._w, cls._h = os.get_terminal_size()
 
-		Key.mouse = {}
+		Key.mouse_clear()
 		Box.calc_sizes()
 		if Init.running: cls.resized = False; return
 		if Menu.active: Menu.resized = True
@@ -699,17 +983,6 @@ class Raw(object):
 	def __exit__(self, type, value, traceback):
 		termios.tcsetattr(self.stream, termios.TCSANOW, self.original_stty)
 
-class Nonblocking(object):
-	"""Set nonblocking mode for device"""
-	def __init__(self, stream):
-		self.stream = stream
-		self.fd = self.stream.fileno()
-	def __enter__(self):
-		self.orig_fl = fcntl.fcntl(self.fd, fcntl.F_GETFL)
-		fcntl.fcntl(self.fd, fcntl.F_SETFL, self.orig_fl | os.O_NONBLOCK)
-	def __exit__(self, *args):
-		fcntl.fcntl(self.fd, fcntl.F_SETFL, self.orig_fl)
-
 class Mv:
 	"""Class with collection of cursor movement functions: .t[o](line, column) | .r[ight](columns) | .l[eft](columns) | .u[p](lines) | .d[own](lines) | .save() | .restore()"""
 	@staticmethod
@@ -739,7 +1012,8 @@ class Mv:
 class Key:
 	"""Handles the threaded input reader for keypresses and mouse events"""
 	list: List[str] = []
-	mouse: Dict[str, List[List[int]]] = {}
+	mouse: Dict[str, Tuple[str, int, int, int, int]] = {}
+	mouse_grid: List[List[str]] = []
 	mouse_pos: Tuple[int, int] = (0, 0)
 	escape: Dict[Union[str, Tuple[str, str]], str] = {
 		"\n" :					"enter",
@@ -769,16 +1043,16 @@ class Key:
 		"[23" :					"f11",
 		"[24" :					"f12"
 		}
+	escape_trie: Dict[str, Any] = {}
 	new = threading.Event()
-	idle = threading.Event()
 	mouse_move = threading.Event()
 	mouse_report: bool = False
-	idle.set()
 	stopping: bool = False
 	started: bool = False
 	reader: threading.Thread
 	@classmethod
 	def start(cls):
+		if not cls.escape_trie: cls.escape_trie = cls._build_trie()
 		cls.stopping = False
 		cls.reader = threading.Thread(target=cls._get_key)
 		cls.reader.start()
@@ -826,6 +1100,40 @@ class Key:
 	def clear(cls):
 		cls.list = []
 
+	@classmethod
+	def mouse_add(cls, key: str, x: int, y: int, width: int, height: int = 1, box: str = ""):
+		"""Make the rectangle at x, y clickable as key, replacing earlier area of key, box is the name used to clear areas together"""
+		if not cls.mouse_grid: cls.mouse_clear()
+		if key in cls.mouse: cls.mouse_del(key)
+		cls.mouse[key] = (box, x, y, width, height)
+		for row in cls.mouse_grid[max(y, 0):y + height]:
+			row[max(x, 0):x + width] = [key] * len(row[max(x, 0):x + width])
+
+	@classmethod
+	def mouse_del(cls, *keys: str):
+		"""Remove clickable areas of keys"""
+		for key in keys:
+			if key not in cls.mouse: continue
+			_, x, y, width, height = cls.mouse.pop(key)
+			for row in cls.mouse_grid[max(y, 0):y + height]:
+				for col in range(max(x, 0), min(x + width, len(row))):
+					if row[col] == key: row[col] = ""
+
+	@classmethod
+	def mouse_clear(cls, box: str = ""):
+		"""Remove clickable areas registered by box, or all areas and resize grid to terminal if no box given"""
+		if box:
+			cls.mouse_del(*[key for key, area in cls.mouse.items() if area[0] == box])
+		else:
+			cls.mouse = {}
+			cls.mouse_grid = [[""] * (Term.width + 1) for _ in range(Term.height + 1)]
+
+	@classmethod
+	def mouse_at(cls, x: int, y: int) -> str:
+		"""Returns key clickable at x, y or empty string"""
+		if 0 <= y < len(cls.mouse_grid) and 0 <= x < len(cls.mouse_grid[y]): return cls.mouse_grid[y][x]
+		return ""
+
 	@classmethod
 	def input_wait(cls, sec: float = 0.0, mouse: bool = False) -> bool:
 		'''Returns True if key is detected else waits out timer and returns False'''
@@ -849,78 +1157,134 @@ class Key:
 
 	@classmethod
 	def _get_key(cls):
-		"""Get a key or escape sequence from stdin, convert to readable format and save to keys list. Meant to be run in it's own thread."""
-		input_key: str = ""
-		clean_key: str = ""
+		"""Read stdin in batches, decode keys and mouse events and save to keys list. Meant to be run in it's own thread."""
+		fd: int = sys.stdin.fileno()
+		decoder = getincrementaldecoder("utf-8")(errors="ignore")
+		pending: str = ""
+		keys: List[str]
+		data: bytes
 		try:
-			while not cls.stopping:
-				with Raw(sys.stdin):
-					if not select([sys.stdin], [], [], 0.1)[0]:			#* Wait 100ms for input on stdin then restart loop to check for stop flag
+			with Raw(sys.stdin), selectors.DefaultSelector() as selector:
+				selector.register(fd, selectors.EVENT_READ)
+				while not cls.stopping:
+					if not selector.select(0.01 if pending else 0.1):	#* Wait 100ms for input then restart loop to check for stop flag
+						if pending:										#* Nothing followed an incomplete escape sequence within 10ms, decode it as is
+							keys, pending = cls._decode(pending, final=True)
+							cls._store(keys)
 						continue
-					input_key += sys.stdin.read(1)						#* Read 1 key safely with blocking on
-					if input_key == "\033":								#* If first character is a escape sequence keep reading
-						cls.idle.clear()								#* Report IO block in progress to prevent Draw functions from getting a IO Block error
-						Draw.idle.wait()								#* Wait for Draw function to finish if busy
-						with Nonblocking(sys.stdin): 					#* Set non blocking to prevent read stall
-							input_key += sys.stdin.read(20)
-							if input_key.startswith("\033[<"):
-								_ = sys.stdin.read(1000)
-						cls.idle.set()									#* Report IO blocking done
-					#errlog.debug(f'{repr(input_key)}')
-					if input_key == "\033":	clean_key = "escape"		#* Key is "escape" key if only containing \033
-					elif input_key.startswith(("\033[<0;", "\033[<35;", "\033[<64;", "\033[<65;")): #* Detected mouse event
-						try:
-							cls.mouse_pos = (int(input_key.split(";")[1]), int(input_key.split(";")[2].rstrip("mM")))
-						except:
-							pass
-						else:
-							if input_key.startswith("\033[<35;"):		#* Detected mouse move in mouse direct mode
-									cls.mouse_move.set()
-									cls.new.set()
-							elif input_key.startswith("\033[<64;"):		#* Detected mouse scroll up
-								clean_key = "mouse_scroll_up"
-							elif input_key.startswith("\033[<65;"):		#* Detected mouse scroll down
-								clean_key = "mouse_scroll_down"
-							elif input_key.startswith("\033[<0;") and input_key.endswith("m"): #* Detected mouse click release
-								if Menu.active:
-									clean_key = "mouse_click"
-								else:
-									for key_name, positions in cls.mouse.items(): #* Check if mouse position is clickable
-										if list(cls.mouse_pos) in positions:
-											clean_key = key_name
-											break
-									else:
-										clean_key = "mouse_click"
-					elif input_key == "\\": clean_key = "\\"			#* Clean up "\" to not return escaped
-					else:
-						for code in cls.escape.keys():					#* Go trough dict of escape codes to get the cleaned key name
-							if input_key.lstrip("\033").startswith(code):
-								clean_key = cls.escape[code]
-								break
-						else:											#* If not found in escape dict and length of key is 1, assume regular character
-							if len(input_key) == 1:
-								clean_key = input_key
-					if clean_key:
-						cls.list.append(clean_key)						#* Store up to 10 keys in input queue for later processing
-						if len(cls.list) > 10: del cls.list[0]
-						clean_key = ""
-						cls.new.set()									#* Set threading event to interrupt main thread sleep
-					input_key = ""
-
-
+					data = os.read(fd, 1024)
+					if not data: break
+					keys, pending = cls._decode(pending + decoder.decode(data))
+					cls._store(keys)
 		except Exception as e:
 			errlog.exception(f'Input thread failed with exception: {e}')
-			cls.idle.set()
 			cls.list.clear()
 			clean_quit(1, thread=True)
 
+	@classmethod
+	def _store(cls, keys: List[str]):
+		if not keys: return
+		cls.list.extend(keys)
+		if len(cls.list) > 10: del cls.list[:-10]				#* Store up to 10 keys in input queue for later processing
+		cls.new.set()												#* Set threading event to interrupt main thread sleep
+
+	@classmethod
+	def _decode(cls, data: str, final: bool = False) -> Tuple[List[str], str]:
+		"""Convert a batch of input to key names, returns keys and trailing incomplete escape sequence unless final is True.
+		Mouse moves in the batch are coalesced into one event at the last position."""
+		keys: List[str] = []
+		moved: bool = False
+		length: int = len(data)
+		i: int = 0
+		end: int
+		key: str
+		while i < length:
+			if data[i] != "\033":
+				keys.append(cls._lookup(data[i]) or data[i])
+				i += 1
+				continue
+			if i + 1 == length or data[i + 1] == "\033":				#* Key is "escape" key if not followed by a sequence
+				if i + 1 == length and not final: break
+				keys.append("escape")
+				i += 1
+				continue
+			if data[i + 1] == "[":										#* CSI sequence ends at first character in range "@" to "~"
+				end = i + 2
+				while end < length and not "\x40" <= data[end] <= "\x7e": end += 1
+			elif data[i + 1] == "O":
+				end = i + 2
+			else:
+				end = i + 1												#* Alt + key, not used
+			if end >= length:
+				if not final: break
+				i = length
+				continue
+			sequence: str = data[i + 1:end + 1]
+			i = end + 1
+			if sequence.startswith("[<"):								#* Detected mouse event
+				key = cls._mouse(sequence)
+				if key == "mouse_move":
+					moved = True
+				elif key:
+					moved = False
+					keys.append(key)
+			else:
+				key = cls._lookup(sequence)
+				if key: keys.append(key)
+		if moved:
+			cls.mouse_move.set()
+			cls.new.set()
+		return keys, data[i:]
+
+	@classmethod
+	def _lookup(cls, sequence: str) -> str:
+		"""Walk the escape code trie and return name of the longest code that sequence starts with"""
+		node: Dict[str, Any] = cls.escape_trie
+		name: str = ""
+		for char in sequence:
+			if char not in node: break
+			node = node[char]
+			name = node.get("", name)
+		return name
+
+	@classmethod
+	def _mouse(cls, sequence: str) -> str:
+		"""Convert a SGR mouse report to a key name and set mouse position"""
+		try:
+			button, mx, my = sequence[2:-1].split(";")
+			pos: Tuple[int, int] = (int(mx), int(my))
+		except ValueError:
+			return ""
+		if button not in ("0", "35", "64", "65"): return ""
+		cls.mouse_pos = pos
+		if button == "35": return "mouse_move"							#* Detected mouse move in mouse direct mode
+		if button == "64": return "mouse_scroll_up"
+		if button == "65": return "mouse_scroll_down"
+		if sequence.endswith("M"): return ""							#* Mouse click press, wait for release
+		if Menu.active: return "mouse_click"
+		return cls.mouse_at(*pos) or "mouse_click"						#* Check if mouse position is clickable
+
+	@classmethod
+	def _build_trie(cls) -> Dict[str, Any]:
+		"""Returns a character trie of the escape codes with the key names stored under "" """
+		trie: Dict[str, Any] = {}
+		node: Dict[str, Any]
+		for codes, name in cls.escape.items():
+			for code in (codes if isinstance(codes, tuple) else (codes,)):
+				node = trie
+				for char in code:
+					node = node.setdefault(char, {})
+				node[""] = name
+		return trie
+
 class Draw:
 	'''Holds the draw buffer and manages IO blocking queue
 	* .buffer([+]name[!], *args, append=False, now=False, z=100) : Add *args to buffer
 	* - Adding "+" prefix to name sets append to True and appends to name's current string
 	* - Adding "!" suffix to name sets now to True and print name's current string
 	* .out(clear=False) : Print all strings in buffer, clear=True clear all buffers after
-	* .now(*args) : Prints all arguments as a string
+	* .now(*args, diff=False) : Prints all arguments as a string, diff=True prints only changed cells if CONFIG.diff_render is True
+	* .write(data) : Writes all of data to the terminal with os.write, waiting for the terminal when it can't keep up
 	* .clear(*names) : Clear named buffers, all if no argument
 	* .last_screen() : Prints all saved buffers
 	'''
@@ -933,18 +1297,46 @@ class Draw:
 	idle.set()
 
 	@classmethod
-	def now(cls, *args):
-		'''Wait for input reader and self to be idle then print to screen'''
-		Key.idle.wait()
+	def now(cls, *args, diff: bool = False):
+		'''Wait for self to be idle then print to screen'''
 		cls.idle.wait()
 		cls.idle.clear()
+		out: str = "".join(f'{arg}' for arg in args)
+		if CONFIG.diff_render:
+			try:
+				out = Screen.render(out, diff)
+			except Exception as e:
+				errlog.exception(f'Diff render failed: {e}')
+				Screen.invalidate()
+		elif Screen.width:
+			Screen.invalidate()
+		data: bytes = out.encode()
+		write_start: float = time()
 		try:
-			print(*args, sep="", end="", flush=True)
-		except BlockingIOError:
-			pass
-			Key.idle.wait()
-			print(*args, sep="", end="", flush=True)
-		cls.idle.set()
+			stalls, stall_time = cls.write(data)
+		finally:
+			cls.idle.set()
+		FrameStats.write(len(data), time() - write_start, stalls, stall_time)
+
+	@staticmethod
+	def write(data: bytes) -> Tuple[int, float]:
+		'''Write whole frame to stdout, returns number of times the terminal was not ready and seconds spent waiting for it'''
+		fd: int = sys.stdout.fileno()
+		view = memoryview(data)
+		stalls: int = 0
+		stall_time: float = 0.0
+		sys.stdout.flush()
+		while view:
+			try:
+				view = view[os.write(fd, view):]
+			except BlockingIOError: #* Terminal not ready for more output
+				pass
+			if view:
+				stalls += 1
+				stall_start: float = time()
+				select([], [fd], [], 1)
+				stall_time += time() - stall_start
+		return stalls, stall_time
 
 	@classmethod
 	def buffer(cls, name: str, *args: str, append: bool = False, now: bool = False, z: int = 100, only_save: bool = False, no_save: bool = False, once: bool = False):
@@ -976,22 +1368,24 @@ class Draw:
 			for name in sorted(cls.z_order, key=cls.z_order.get, reverse=True):
 				if name in names and name in cls.strings:
 					out += cls.strings[name]
+					FrameStats.buffer_bytes[name] = len(cls.strings[name].encode())
 					if cls.save[name]:
 						cls.saved[name] = cls.strings[name]
 					if clear or cls.once[name]:
 						cls.clear(name)
-			cls.now(out)
+			cls.now(out, diff=True)
 		else:
 			for name in sorted(cls.z_order, key=cls.z_order.get, reverse=True):
 				if name in cls.strings:
 					out += cls.strings[name]
+					FrameStats.buffer_bytes[name] = len(cls.strings[name].encode())
 					if cls.save[name]:
 						cls.saved[name] = cls.strings[name]
 					if cls.once[name] and not clear:
 						cls.clear(name)
 			if clear:
 				cls.clear()
-			cls.now(out)
+			cls.now(out, diff=True)
 
 	@classmethod
 	def saved_buffer(cls) -> str:
@@ -1025,6 +1419,298 @@ class Draw:
 				cls.saved = {}
 				cls.z_order = {}
 
+class Screen:
+	'''Holds a cell grid of what the terminal is showing, used by Draw.now when CONFIG.diff_render is True
+	* .render(out, diff) : Apply out to the grid, returns only the escapes and characters needed for cells that changed if diff=True, else out
+	* .invalidate() : Forget the grid, cells are unknown until written again
+	* Each cell is a character and a style of (attributes, foreground, background) where colors are kept as sgr parameters
+	'''
+	width: int = 0
+	height: int = 0
+	chars: List[Union[str, None]] = []
+	styles: List[Any] = []
+	shown_chars: List[Union[str, None]] = []
+	shown_styles: List[Any] = []
+	pen: Tuple[FrozenSet[str], str, str] = (frozenset(), "", "")
+	line: int = 0
+	col: int = 0
+	saved_pos: Tuple[int, int] = (0, 0)
+	term_pen: Union[Tuple[FrozenSet[str], str, str], None] = None
+	term_pos: Union[Tuple[int, int], None] = None
+	passthrough: List[str] = []
+	pens: Dict[Tuple[FrozenSet[str], str, str], Tuple[FrozenSet[str], str, str]] = {}
+	changes: Dict[Tuple[Any, Any], str] = {}
+
+	#* Unchanged cells shorter than this between two changed cells are printed again instead of moving the cursor
+	gap: int = 4
+	escape_re = re.compile(r'\033\[([0-9;?]*)([@-~])|\033\][^\a]*\a|\033.?|([\x00-\x1f])|[^\x00-\x1f]+')
+	attrs_on: Set[str] = {"1", "2", "3", "4", "5", "7", "9"}
+	attrs_off: Dict[str, FrozenSet[str]] = {"22" : frozenset(("1", "2")), "23" : frozenset(("3",)), "24" : frozenset(("4",)), "25" : frozenset(("5",)), "27" : frozenset(("7",)), "29" : frozenset(("9",))}
+
+	@classmethod
+	def invalidate(cls):
+		cls.width = cls.height = 0
+		cls.term_pen = cls.term_pos = None
+
+	@classmethod
+	def _resize(cls, width: int, height: int):
+		cls.width, cls.height = width, height
+		cls.chars = [None] * (width * height)
+		cls.styles = [None] * (width * height)
+		cls.shown_chars = cls.chars[:]
+		cls.shown_styles = cls.styles[:]
+		cls.line = min(cls.line, height - 1)
+		cls.col = min(cls.col, width - 1)
+		cls.term_pen = cls.term_pos = None
+
+	@classmethod
+	def render(cls, out: str, diff: bool = False) -> str:
+		if (Term.width, Term.height) != (cls.width, cls.height) or not cls.width:
+			if Term.width < 1 or Term.height < 1: return out
+			cls._resize(Term.width, Term.height)
+		cls.passthrough = []
+		cls._apply(out)
+		if not diff:
+			cls.shown_chars = cls.chars[:]
+			cls.shown_styles = cls.styles[:]
+			cls.term_pen = cls.pen
+			cls.term_pos = (cls.line, cls.col)
+			return out
+		return "".join(cls.passthrough) + cls._diff()
+
+	@classmethod
+	def _apply(cls, out: str):
+		'''Move the cursor, change the pen and write characters to the grid the same way the terminal would'''
+		width, height = cls.width, cls.height
+		chars, styles = cls.chars, cls.styles
+		for match in cls.escape_re.finditer(out):
+			params, command, control = match.groups()
+			if command:
+				if command == "m":
+					cls._sgr(params)
+				elif command in "fH":
+					line, _, col = params.partition(";")
+					cls.line = min(max(int(line or 1), 1), height) - 1
+					cls.col = min(max(int(col or 1), 1), width) - 1
+				elif command in "ABCD" and (params.isdigit() or not params):
+					n = max(int(params or 1), 1)
+					cls.col = min(cls.col, width - 1)
+					if command == "C": cls.col = min(cls.col + n, width - 1)
+					elif command == "D": cls.col = max(cls.col - n, 0)
+					elif command == "A": cls.line = max(cls.line - n, 0)
+					else: cls.line = min(cls.line + n, height - 1)
+				elif command == "s" and not params:
+					cls.saved_pos = (cls.line, cls.col)
+				elif command == "u" and not params:
+					cls.line, cls.col = cls.saved_pos
+				else:
+					#* Modes, screen clears and anything else not known to the grid is passed on and is printed before the changed cells
+					cls.passthrough.append(match.group())
+					if params.startswith("?") and not params in ["?1049", "?47", "?1047"]: continue
+					cls.shown_chars[:] = [None] * len(chars)
+					cls.shown_styles[:] = [None] * len(styles)
+					if command == "J" and params == "2":
+						chars[:] = [" "] * len(chars)
+						styles[:] = [cls._intern((frozenset(), "", cls.pen[2]))] * len(styles)
+					else:
+						chars[:] = [None] * len(chars)
+						styles[:] = [None] * len(styles)
+			elif control:
+				if control in "\r\n": cls.col = 0
+				if control == "\n": cls.line = min(cls.line + 1, height - 1)
+				elif control == "\t": cls.col = min((cls.col // 8 + 1) * 8, width - 1)
+				elif control == "\b": cls.col = max(min(cls.col, width - 1) - 1, 0)
+				elif control != "\r": cls.passthrough.append(control)
+			elif match.group().startswith("\033"):
+				cls.passthrough.append(match.group())
+			else:
+				text: str = match.group()
+				pen = cls.pen
+				while text:
+					if cls.col >= width:
+						if cls.line >= height - 1: break
+						cls.col = 0
+						cls.line += 1
+					n = min(len(text), width - cls.col)
+					i = cls.line * width + cls.col
+					chars[i:i + n] = text[:n]
+					styles[i:i + n] = [pen] * n
+					cls.col += n
+					text = text[n:]
+
+	@classmethod
+	def _intern(cls, pen: Tuple[FrozenSet[str], str, str]) -> Tuple[FrozenSet[str], str, str]:
+		return cls.pens.setdefault(pen, pen)
+
+	@classmethod
+	def _sgr(cls, params: str):
+		attrs, fg, bg = cls.pen
+		codes: List[str] = params.split(";")
+		i: int = 0
+		while i < len(codes):
+			code = codes[i]
+			if code in ["", "0"]:
+				attrs, fg, bg = frozenset(), "", ""
+			elif code in ["38", "48"]:
+				n = {"2" : 5, "5" : 3}.get(codes[i + 1] if i + 1 < len(codes) else "", 1)
+				color = ";".join(codes[i:i + n])
+				if code == "38": fg = color
+				else: bg = color
+				i += n - 1
+			elif code == "39": fg = ""
+			elif code == "49": bg = ""
+			elif code in cls.attrs_on: attrs = attrs | {code}
+			elif code in cls.attrs_off: attrs = attrs - cls.attrs_off[code]
+			elif code.isdigit() and (30 <= int(code) <= 37 or 90 <= int(code) <= 97): fg = code
+			elif code.isdigit() and (40 <= int(code) <= 47 or 100 <= int(code) <= 107): bg = code
+			i += 1
+		cls.pen = cls._intern((frozenset(attrs), fg, bg))
+
+	@classmethod
+	def _change(cls, old: Union[Tuple[FrozenSet[str], str, str], None], new: Tuple[FrozenSet[str], str, str]) -> str:
+		'''Returns the shortest sgr sequence going from pen old to new'''
+		key = (old, new)
+		if key not in cls.changes:
+			if old is None or not old[0] <= new[0]:
+				codes = ["0", *sorted(new[0]), *[color for color in new[1:] if color]]
+			else:
+				codes = sorted(new[0] - old[0])
+				if new[1] != old[1]: codes.append(new[1] or "39")
+				if new[2] != old[2]: codes.append(new[2] or "49")
+			cls.changes[key] = f'\033[{";".join(codes)}m' if codes else ""
+		return cls.changes[key]
+
+	@classmethod
+	def _diff(cls) -> str:
+		'''Returns what needs printing to make the terminal show the grid, then sets the shown grid to the grid'''
+		out: List[str] = []
+		width: int = cls.width
+		chars, styles, shown_chars, shown_styles = cls.chars, cls.styles, cls.shown_chars, cls.shown_styles
+		pen = cls.term_pen
+		pos = cls.term_pos
+		for line in range(cls.height):
+			start = line * width
+			end = start + width
+			if chars[start:end] == shown_chars[start:end] and styles[start:end] == shown_styles[start:end]: continue
+			runs: List[List[int]] = []
+			for i in range(start, end):
+				if chars[i] is None or (chars[i] == shown_chars[i] and styles[i] == shown_styles[i]): continue
+				if runs and i - runs[-1][1] <= cls.gap and None not in chars[runs[-1][1]:i]:
+					runs[-1][1] = i + 1
+				else:
+					runs.append([i, i + 1])
+			for run_start, run_end in runs:
+				col = run_start - start
+				if pos != (line, col):
+					if pos is not None and pos[0] == line and 0 < col - pos[1] < 10:
+						out.append(f'\033[{col - pos[1]}C')
+					else:
+						out.append(f'\033[{line + 1};{col + 1}f')
+				for i in range(run_start, run_end):
+					if styles[i] is not pen:
+						out.append(cls._change(pen, styles[i]))
+						pen = styles[i]
+					out.append(chars[i])
+				pos = (line, run_end - start) if run_end < end else None
+			shown_chars[start:end] = chars[start:end]
+			shown_styles[start:end] = styles[start:end]
+		#* Leave the pen and cursor where the full output would have, for anything printed without diffing after this
+		if pen is not cls.pen: out.append(cls._change(pen, cls.pen))
+		if pos != (cls.line, cls.col): out.append(f'\033[{cls.line + 1};{cls.col + 1}f')
+		cls.term_pen = cls.pen
+		cls.term_pos = (cls.line, cls.col)
+		return "".join(out)
+
+class FrameStats:
+	'''Output size and timing of the drawn frames, exported as "frame" stats rows and shown in an overlay toggled with "d"
+	* .render(name, seconds) : Time spent by a box drawing its buffer
+	* .write(size, seconds, stalls, stall_time) : Bytes printed, time spent printing and how often and how long the terminal was not ready
+	* .report() : End a frame, called once for each frame drawn by the collectors
+	* Frames are summed and exported as one row at most once every update_ms, not one row for every frame
+	* .draw() : Put the overlay with the last reported values in the "frame_stats" buffer
+	* Size of each buffer printed by Draw.out is kept in .buffer_bytes until the next report
+	'''
+	overlay: bool = False
+	buffer_bytes: Dict[str, int] = {}
+	render_times: Dict[str, float] = {}
+	last_buffers: Dict[str, int] = {}
+	last_renders: Dict[str, float] = {}
+	frames: Deque[float] = deque(maxlen=100)
+	written: int = 0
+	write_time: float = 0.0
+	writes: int = 0
+	stalls: int = 0
+	stall_time: float = 0.0
+	total_written: int = 0
+	total_stalls: int = 0
+	last: Dict[str, Union[int, float]] = { "written" : 0, "write_ms" : 0.0, "writes" : 0, "stalls" : 0, "stall_ms" : 0.0, "fps" : 0.0 }
+	pending: Dict[str, Union[int, float]] = {}
+	exported: float = 0.0
+
+	@classmethod
+	def render(cls, name: str, seconds: float):
+		cls.render_times[name] = seconds
+
+	@classmethod
+	def write(cls, size: int, seconds: float, stalls: int = 0, stall_time: float = 0.0):
+		cls.written += size
+		cls.write_time += seconds
+		cls.writes += 1
+		cls.total_written += size
+		cls.stalls += stalls
+		cls.stall_time += stall_time
+		cls.total_stalls += stalls
+
+	@classmethod
+	def fps(cls) -> float:
+		'''Frames per second over the last 10 seconds'''
+		now: float = time()
+		while cls.frames and now - cls.frames[0] > 10:
+			cls.frames.popleft()
+		if len(cls.frames) < 2: return 0.0
+		return (len(cls.frames) - 1) / max(now - cls.frames[0], 0.001)
+
+	@classmethod
+	def report(cls):
+		cls.frames.append(time())
+		cls.last = { "written" : cls.written, "write_ms" : round(cls.write_time * 1000, 3), "writes" : cls.writes,
+			"stalls" : cls.stalls, "stall_ms" : round(cls.stall_time * 1000, 3), "fps" : round(cls.fps(), 2) }
+		values: Dict[str, Union[int, float]] = { **cls.last, "frames" : 1,
+			**{ f'{name}.bytes' : size for name, size in cls.buffer_bytes.items() },
+			**{ f'{name}.ms' : seconds * 1000 for name, seconds in cls.render_times.items() } }
+		del values["fps"]
+		for name, value in values.items():
+			cls.pending[name] = cls.pending.get(name, 0) + value
+		if cls.frames[-1] - cls.exported >= CONFIG.update_ms / 1000:
+			report("frame", fps=cls.last["fps"], **{ name : round(value, 3) for name, value in cls.pending.items() })
+			cls.pending = {}
+			cls.exported = cls.frames[-1]
+		cls.last_buffers, cls.last_renders = cls.buffer_bytes, cls.render_times
+		cls.buffer_bytes, cls.render_times = {}, {}
+		cls.written = cls.writes = cls.stalls = 0
+		cls.write_time = cls.stall_time = 0.0
+
+	@classmethod
+	def draw(cls):
+		names: List[str] = sorted((name for name in cls.last_buffers if name != "frame_stats"), key=lambda name: cls.last_buffers[name], reverse=True)[:5]
+		width: int = 34
+		height: int = 12
+		x: int = max(Term.width - width - 1, 1)
+		y: int = 2
+		out: str = create_box(x, y, width, height, "frame", line_color=THEME.div_line)
+		lines: List[str] = [
+			f'{"fps":<12}{cls.last["fps"]:>9.1f}',
+			f'{"written":<12}{floating_humanizer(cls.last["written"], short=True):>9}{cls.last["write_ms"]:>8.1f} ms',
+			f'{"total":<12}{floating_humanizer(cls.total_written, short=True):>9}',
+			f'{"stalls":<12}{cls.total_stalls:>9}{cls.last["stall_ms"]:>8.1f} ms',
+			f'{"buffer":<12}{"bytes":>9}{"draw":>11}']
+		for name in names:
+			draw_ms: str = f'{cls.last_renders[name] * 1000:>8.1f} ms' if name in cls.last_renders else ""
+			lines.append(f'{name[:11]:<12}{floating_humanizer(cls.last_buffers[name], short=True):>9}{draw_ms}')
+		for n, line in enumerate(lines):
+			out += f'{Mv.to(y + 1 + n, x + 1)}{THEME.title if n == 4 else THEME.main_fg}{line[:width - 2]}'
+		Draw.buffer("frame_stats", f'{out}{Term.fg}', z=0)
+
 class Color:
 	'''Holds representations for a 24-bit color value
 	__init__(color, depth="fg", default=False)
@@ -1091,7 +1777,7 @@ class Color:
 
 	def __call__(self, *args: str) -> str:
 		if len(args) < 1: return ""
-		return f'{self.escape}{"".join(args)}{getattr(Term, self.depth)}'
+		return f'{self.escape}{"".join(args)}{Term.fg if self.depth == "fg" else Term.bg}'
 
 	@staticmethod
 	def escape_color(hexa: str = "", r: int = 0, g: int = 0, b: int = 0, depth: str = "fg") -> str:
@@ -1141,7 +1827,9 @@ class Theme:
 
 	themes: Dict[str, str] = {}
 	cached: Dict[str, Dict[str, str]] = { "Default" : DEFAULT_THEME }
+	gradients: Dict[str, Dict[str, List[str]]] = {}
 	current: str = ""
+	proc_fade: List[str] = []
 
 	main_bg = main_fg = title = hi_fg = selected_bg = selected_fg = inactive_fg = proc_misc = cpu_box = mem_box = net_box = proc_box = div_line = temp_start = temp_mid = temp_end = cpu_start = cpu_mid = cpu_end = free_start = free_mid = free_end = cached_start = cached_mid = cached_end = available_start = available_mid = available_end = used_start = used_mid = used_end = download_start = download_mid = download_end = upload_start = upload_mid = upload_end = graph_text = meter_bg = process_start = process_mid = process_end = NotImplemented
 
@@ -1163,7 +1851,6 @@ class Theme:
 		self._load_theme(theme)
 
 	def __call__(self, theme: str):
-		for k in self.gradient.keys(): self.gradient[k] = []
 		self._load_theme(theme)
 
 	def _load_theme(self, theme: str):
@@ -1199,13 +1886,29 @@ class Theme:
 			else:
 				setattr(self, item, Color(value, depth=depth, default=default))
 
-		#* Create color gradients from one, two or three colors, 101 values indexed 0-100
+		#* Create color gradients from one, two or three colors, 101 values indexed 0-100, built once per theme
 		self.proc_start, self.proc_mid, self.proc_end = self.main_fg, Colors.null, self.inactive_fg
 		self.proc_color_start, self.proc_color_mid, self.proc_color_end = self.inactive_fg, Colors.null, self.process_start
 
+		if theme in self.gradients:
+			self.gradient = self.gradients[theme]
+		else:
+			self.gradient = self.gradients[theme] = self._gradients()
+		#* Process rows fade from proc_color into process, indexed 0-200
+		self.proc_fade = self.gradient["proc_color"][:100] + self.gradient["process"]
+
+		#* Set terminal colors
+		Term.fg = self.main_fg.escape
+		Term.bg = self.main_bg.escape if CONFIG.theme_background else "\033[49m"
+		Meter.cache.clear()
+		Draw.now(self.main_fg, self.main_bg)
+
+	def _gradients(self) -> Dict[str, List[str]]:
+		'''Returns escape sequence tables for all gradients of the loaded theme colors'''
+		gradient: Dict[str, List[str]] = { name : [] for name in self.gradient }
 		rgb: Dict[str, Tuple[int, int, int]]
 		colors: List[List[int]] = []
-		for name in self.gradient:
+		for name in gradient:
 			rgb = { "start" : getattr(self, f'{name}_start').dec, "mid" : getattr(self, f'{name}_mid').dec, "end" : getattr(self, f'{name}_end').dec }
 			colors = [ list(getattr(self, f'{name}_start')) ]
 			if rgb["end"][0] >= 0:
@@ -1215,16 +1918,13 @@ class Theme:
 						colors += [[rgb[first][n] + i * (rgb[second][n] - rgb[first][n]) // r for n in range(3)]]
 					if r == 100:
 						break
-				self.gradient[name] += [ Color.fg(*color) for color in colors ]
+				gradient[name] += [ Color.fg(*color) for color in colors ]
 
 			else:
 				c = Color.fg(*rgb["start"])
 				for _ in range(101):
-					self.gradient[name] += [c]
-		#* Set terminal colors
-		Term.fg = self.main_fg
-		Term.bg = self.main_bg if CONFIG.theme_background else "\033[49m"
-		Draw.now(self.main_fg, self.main_bg)
+					gradient[name] += [c]
+		return gradient
 
 	@classmethod
 	def refresh(cls):
@@ -1322,6 +2022,11 @@ class Symbol:
 	}
 	graph_down_small = graph_down.copy()
 	graph_down_small[0.0] = "\033[1C"
+	#* Same symbols as lists indexed with left * 5 + right
+	graph_up_glyphs: List[str] = list(graph_up.values())
+	graph_up_small_glyphs: List[str] = list(graph_up_small.values())
+	graph_down_glyphs: List[str] = list(graph_down.values())
+	graph_down_small_glyphs: List[str] = list(graph_down_small.values())
 	meter: str = "■"
 	up: str = "↑"
 	down: str = "↓"
@@ -1331,17 +2036,121 @@ class Symbol:
 	ok: str = f'{Color.fg("#30ff50")}√{Color.fg("#cc")}'
 	fail: str = f'{Color.fg("#ff3050")}!{Color.fg("#cc")}'
 
+class Rate:
+	'''Per second rates of increasing counters, measured against one monotonic clock sample per collection
+	* .tick() : Sample the clock, call once per collection before any .per_second()
+	* .per_second(key, value) : Rate of counter key since last tick, 0.0 if key wasn't seen at last tick
+	* .reset(*keys) : Forget last value of keys, next rate is 0.0
+	* A counter lower than at last tick is taken as reset and rated 0.0, or as wrapped if a wrap width in bits is given and the difference fits in it
+	* psutil net and disk counters are 64 bit and already unwrapped, only pass wrap for raw counters of known width
+	* Only keys seen at last tick are kept, counters that stop being sampled are dropped
+	'''
+	wrap: int
+	last: Dict[Any, int]
+	current: Dict[Any, int]
+	timestamp: float
+	seconds: float
+
+	def __init__(self, wrap: int = 0):
+		self.wrap = 1 << wrap if wrap else 0
+		self.last = {}
+		self.current = {}
+		self.timestamp = 0.0
+		self.seconds = 0.0
+
+	def tick(self):
+		now: float = monotonic()
+		self.seconds = now - self.timestamp if self.timestamp else 0.0
+		self.timestamp = now
+		self.last, self.current = self.current, {}
+
+	def per_second(self, key: Any, value: int) -> float:
+		self.current[key] = value
+		last: Optional[int] = self.last.get(key)
+		if last is None or self.seconds <= 0: return 0.0
+		delta: int = value - last
+		if delta < 0:
+			if not self.wrap: return 0.0
+			delta += self.wrap
+			if delta < 0 or delta > self.wrap // 2: return 0.0
+		return delta / self.seconds
+
+	def reset(self, *keys: Any):
+		for key in keys:
+			self.last.pop(key, None)
+
+class RingBuffer:
+	'''Fixed size history of integers backed by a typed array, the oldest value is dropped when full
+	* append(value) : Add a value in O(1)
+	* view() : Zero copy memoryview of all values, oldest first, only valid until next resize()
+	* resize(capacity) : Change capacity keeping the newest values, no-op if unchanged
+	* copy() : Returns a new RingBuffer with the same capacity and values
+	* Supports len(), iteration and indexing, slices are returned as zero copy memoryviews
+	'''
+	typecode: str
+	capacity: int
+	data: array
+	start: int
+	length: int
+
+	def __init__(self, capacity: int, typecode: str = "i", data: Iterable[int] = ()):
+		self.typecode = typecode
+		self.capacity = max(1, capacity)
+		#* Every value is written twice, capacity apart, so the current window is always one contiguous slice
+		self.data = array(typecode, bytes(2 * self.capacity * array(typecode).itemsize))
+		self.start = self.length = 0
+		for value in data:
+			self.append(value)
+
+	def append(self, value: int):
+		pos: int = (self.start + self.length) % self.capacity
+		self.data[pos] = self.data[pos + self.capacity] = value
+		if self.length < self.capacity:
+			self.length += 1
+		else:
+			self.start = (self.start + 1) % self.capacity
+
+	def view(self) -> memoryview:
+		return memoryview(self.data)[self.start:self.start + self.length]
+
+	def resize(self, capacity: int):
+		if max(1, capacity) == self.capacity: return
+		values = self.view()[-max(1, capacity):]
+		self.__init__(capacity, self.typecode, values) # type: ignore
+		values.release()
+
+	def copy(self) -> 'RingBuffer':
+		return RingBuffer(self.capacity, self.typecode, self.view())
+
+	def __len__(self) -> int:
+		return self.length
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self.view())
+
+	def __getitem__(self, key: Union[int, slice]):
+		if isinstance(key, slice): return self.view()[key]
+		if key < 0: key += self.length
+		if not 0 <= key < self.length: raise IndexError("RingBuffer index out of range")
+		return self.data[self.start + key]
+
+	def __repr__(self) -> str:
+		return f'RingBuffer({self.capacity}, {self.typecode!r}, {list(self.view())})'
+
+
 class Graph:
 	'''Class for creating and adding to graphs
-	* __str__ : returns graph as a string
+	* __str__ : returns graph as a string, joined when first asked for after a change and cached until the next value
 	* add(value: int) : adds a value to graph and returns it as a string
 	* __call__ : same as add
+	* Graph.batch(width, height, color, datas, ...) : returns a list of graphs with the same shape, one for each data set in datas
 	'''
-	out: str
+	out: Union[str, None]
 	width: int
 	height: int
 	graphs: Dict[bool, List[str]]
 	colors: List[str]
+	prefixes: List[str]
 	invert: bool
 	max_value: int
 	color_max_value: int
@@ -1349,20 +2158,20 @@ class Graph:
 	current: bool
 	last: int
 	symbol: Dict[float, str]
+	glyphs: List[str]
+	levels: Dict[int, List[bytes]] = {}
+	levels5: Dict[int, List[bytes]] = {}
+	clamp: bytes = bytes(min(i, 100) for i in range(256))
 
-	def __init__(self, width: int, height: int, color: Union[List[str], Color, None], data: List[int], invert: bool = False, max_value: int = 0, offset: int = 0, color_max_value: Union[int, None] = None):
+	def __init__(self, width: int, height: int, color: Union[List[str], Color, None], data: Union[List[int], RingBuffer], invert: bool = False, max_value: int = 0, offset: int = 0, color_max_value: Union[int, None] = None, build: bool = True):
 		self.graphs: Dict[bool, List[str]] = {False : [], True : []}
 		self.current: bool = True
+		self.out = None
 		self.width = width
 		self.height = height
 		self.invert = invert
 		self.offset = offset
-		if not data: data = [0]
-		if max_value:
-			self.max_value = max_value
-			data = [ min(100, (v + offset) * 100 // (max_value + offset)) for v in data ] #* Convert values to percentage values of max_value with max_value as ceiling
-		else:
-			self.max_value = 0
+		self.max_value = max_value
 		if color_max_value:
 			self.color_max_value = color_max_value
 		else:
@@ -1380,60 +2189,107 @@ class Graph:
 		else:
 			if isinstance(color, list): self.colors = color
 			elif isinstance(color, Color): self.colors = [ f'{color}' for _ in range(101) ]
+		#* Color and cursor movement before each row is the same for every draw, except the color of a single row graph
+		self.prefixes = [f'{Mv.d(1) + Mv.l(self.width) if h else ""}{self.colors[h] if self.colors else ""}' for h in range(self.height)]
 		if self.height == 1:
 			self.symbol = Symbol.graph_down_small if invert else Symbol.graph_up_small
+			self.glyphs = Symbol.graph_down_small_glyphs if invert else Symbol.graph_up_small_glyphs
 		else:
 			self.symbol = Symbol.graph_down if invert else Symbol.graph_up
-		value_width: int = ceil(len(data) / 2)
-		filler: str = ""
-		if value_width > width: #* If the size of given data set is bigger then width of graph, shrink data set
-			data = data[-(width*2):]
-			value_width = ceil(len(data) / 2)
-		elif value_width < width: #* If the size of given data set is smaller then width of graph, fill graph with whitespace
-			filler = self.symbol[0.0] * (width - value_width)
-		if len(data) % 2: data.insert(0, 0)
-		for _ in range(height):
-			for b in [True, False]:
-				self.graphs[b].append(filler)
-		self._create(data, new=True)
-
-	def _create(self, data: List[int], new: bool = False):
-		h_high: int
-		h_low: int
-		value: Dict[str, int] = { "left" : 0, "right" : 0 }
-		val: int
-		side: str
-
-		#* Create the graph
-		for h in range(self.height):
-			h_high = round(100 * (self.height - h) / self.height) if self.height > 1 else 100
-			h_low = round(100 * (self.height - (h + 1)) / self.height) if self.height > 1 else 0
-			for v in range(len(data)):
-				if new: self.current = bool(v % 2) #* Switch between True and False graphs
-				if new and v == 0: self.last = 0
-				for val, side in [self.last, "left"], [data[v], "right"]: # type: ignore
-					if val >= h_high:
-						value[side] = 4
-					elif val <= h_low:
-						value[side] = 0
-					else:
-						if self.height == 1: value[side] = round(val * 4 / 100 + 0.5)
-						else: value[side] = round((val - h_low) * 4 / (h_high - h_low) + 0.1)
-				if new: self.last = data[v]
-				self.graphs[self.current][h] += self.symbol[float(value["left"] + value["right"] / 10)]
-		if data: self.last = data[-1]
-		self.out = ""
+			self.glyphs = Symbol.graph_down_glyphs if invert else Symbol.graph_up_glyphs
+		if build: self._build([self], [data])
+
+	@classmethod
+	def batch(cls, width: int, height: int, color: Union[List[str], Color, None], datas: Iterable[Union[List[int], RingBuffer]], invert: bool = False, max_value: int = 0, offset: int = 0, color_max_value: Union[int, None] = None) -> List['Graph']:
+		'''Create graphs with the same shape for all data sets in datas, building the rows of all graphs together'''
+		datas = list(datas)
+		graphs: List[Graph] = [cls(width, height, color, [], invert=invert, max_value=max_value, offset=offset, color_max_value=color_max_value, build=False) for _ in datas]
+		if graphs: cls._build(graphs, datas)
+		return graphs
+
+	def _values(self, data: Union[List[int], RingBuffer, memoryview]) -> bytes:
+		'''Returns data as bytes of percentages clamped to 0-100, newest width * 2 values only'''
+		if self.max_value:
+			data = data[-(self.width*2):]
+			return bytes(min(100, max(0, int((v + self.offset) * 100 // (self.max_value + self.offset)))) for v in data) #* Convert values to percentage values of max_value with max_value as ceiling
+		if isinstance(data, RingBuffer) and data.typecode == "B":
+			return bytes(data[-(self.width*2):]).translate(self.clamp)
+		return bytes(min(100, max(0, int(v))) for v in data[-(self.width*2):])
+
+	@classmethod
+	def _build(cls, graphs: List['Graph'], datas: List[Union[List[int], RingBuffer]]):
+		'''Create all rows of graphs with the same shape from whole data sets in one pass
+		* Every value is turned in to the dots for a row with a translate table, the left and right dots of each symbol
+		* are added together as big integers, each byte stays below 25 so there is no carry between them'''
+		first: Graph = graphs[0]
+		lefts: List[bytes] = []
+		rights: List[bytes] = []
+		for graph, data in zip(graphs, datas):
+			values: bytes = graph._values(data) if data else b'\x00'
+			if len(values) % 2: values = b'\x00' + values
+			rights.append(values)
+			lefts.append(b'\x00' + values[:-1])
+			graph.last = values[-1]
+			graph.current = True
+		size: int = sum(len(values) for values in rights)
+		left: bytes = b"".join(lefts)
+		right: bytes = b"".join(rights)
+		glyph_map: Dict[int, str] = dict(enumerate(first.glyphs))
+		for level, level5 in zip(cls._levels(first.height), cls._levels5(first.height)):
+			codes: bytes = (int.from_bytes(left.translate(level5), "big") + int.from_bytes(right.translate(level), "big")).to_bytes(size, "big")
+			start: int = 0
+			for graph, values in zip(graphs, rights):
+				end: int = start + len(values)
+				filler: str = graph.glyphs[0] * (graph.width - len(values) // 2) #* If the size of given data set is smaller then width of graph, fill graph with whitespace
+				graph.graphs[False].append(filler + codes[start:end:2].decode("latin-1").translate(glyph_map))
+				graph.graphs[True].append(filler + codes[start + 1:end:2].decode("latin-1").translate(glyph_map))
+				start = end
 
+	@classmethod
+	def _levels(cls, height: int) -> List[bytes]:
+		'''Returns a table for each row of a graph with given height, mapping values 0-100 to the 0-4 dots filled in that row'''
+		if height not in cls.levels:
+			tables: List[bytes] = []
+			for h in range(height):
+				h_high: int = round(100 * (height - h) / height) if height > 1 else 100
+				h_low: int = round(100 * (height - (h + 1)) / height) if height > 1 else 0
+				table: List[int] = []
+				for val in range(256):
+					if val >= h_high: table.append(4)
+					elif val <= h_low: table.append(0)
+					elif height == 1: table.append(round(val * 4 / 100 + 0.5))
+					else: table.append(round((val - h_low) * 4 / (h_high - h_low) + 0.1))
+				tables.append(bytes(table))
+			cls.levels[height] = tables
+			cls.levels5[height] = [bytes(dots * 5 for dots in table) for table in tables]
+		return cls.levels[height]
+
+	@classmethod
+	def _levels5(cls, height: int) -> List[bytes]:
+		'''Same as _levels() with the dots multiplied by 5, for the left side of a symbol'''
+		cls._levels(height)
+		return cls.levels5[height]
+
+	def _create(self, value: int):
+		glyphs: List[str] = self.glyphs
+		value = min(max(int(value), 0), 100)
+
+		#* Add the new value to each row of the current graph
+		for h, level in enumerate(self._levels(self.height)):
+			self.graphs[self.current][h] += glyphs[level[self.last] * 5 + level[value]]
+		self.last = value
+		self.out = None
+
+	def _draw(self):
+		rows: List[str] = self.graphs[self.current]
 		if self.height == 1:
-			self.out += f'{"" if not self.colors else self.colors[self.last]}{self.graphs[self.current][0]}'
-		elif self.height > 1:
-			for h in range(self.height):
-				if h > 0: self.out += f'{Mv.d(1)}{Mv.l(self.width)}'
-				self.out += f'{"" if not self.colors else self.colors[h]}{self.graphs[self.current][h if not self.invert else (self.height - 1) - h]}'
+			self.out = f'{"" if not self.colors else self.colors[self.last]}{rows[0]}'
+		else:
+			self.out = "".join(f'{prefix}{row}' for prefix, row in zip(self.prefixes, rows if not self.invert else reversed(rows)))
 		if self.colors: self.out += f'{Term.fg}'
 
 	def __call__(self, value: Union[int, None] = None) -> str:
-		if not isinstance(value, int): return self.out
+		if not isinstance(value, int): return str(self)
 		self.current = not self.current
 		if self.height == 1:
 			if self.graphs[self.current][0].startswith(self.symbol[0.0]):
@@ -1444,14 +2300,15 @@ class Graph:
 			for n in range(self.height):
 				self.graphs[self.current][n] = self.graphs[self.current][n][1:]
 		if self.max_value: value = (value + self.offset) * 100 // (self.max_value + self.offset) if value < self.max_value else 100
-		self._create([value])
-		return self.out
+		self._create(value)
+		return str(self)
 
 	def add(self, value: Union[int, None] = None) -> str:
 		return self.__call__(value)
 
 	def __str__(self):
-		return self.out
+		if self.out is None: self._draw()
+		return self.out # type: ignore
 
 	def __repr__(self):
 		return repr(self.out)
@@ -1472,6 +2329,8 @@ class Meter:
 	__init__(value, width, theme, gradient_name) to create new meter
 	__call__(value) to set value and return meter as a string
 	__str__ returns last set meter as a string
+	Meter strings are shared by all meters in a cache keyed by (gradient_name, width, invert, value, theme),
+	least recently used strings are dropped when more than Meter.cache_size is saved, cleared when a theme is loaded
 	'''
 	out: str
 	color_gradient: List[str]
@@ -1479,14 +2338,14 @@ class Meter:
 	gradient_name: str
 	width: int
 	invert: bool
-	saved: Dict[int, str]
+	cache: Dict[Tuple[str, int, bool, int, str], str] = OrderedDict()
+	cache_size: int = 4096
 
 	def __init__(self, value: int, width: int, gradient_name: str, invert: bool = False):
 		self.gradient_name = gradient_name
 		self.color_gradient = THEME.gradient[gradient_name]
 		self.color_inactive = THEME.meter_bg
 		self.width = width
-		self.saved = {}
 		self.invert = invert
 		self.out = self._create(value)
 
@@ -1494,10 +2353,7 @@ class Meter:
 		if not isinstance(value, int): return self.out
 		if value > 100: value = 100
 		elif value < 0: value = 100
-		if value in self.saved:
-			self.out = self.saved[value]
-		else:
-			self.out = self._create(value)
+		self.out = self._create(value)
 		return self.out
 
 	def __str__(self) -> str:
@@ -1509,7 +2365,18 @@ class Meter:
 	def _create(self, value: int) -> str:
 		if value > 100: value = 100
 		elif value < 0: value = 100
-		out: str = ""
+		key: Tuple[str, int, bool, int, str] = (self.gradient_name, self.width, self.invert, value, THEME.current)
+		out: Union[str, None] = self.cache.get(key)
+		if out is not None:
+			try:
+				self.cache.move_to_end(key) # type: ignore
+			except KeyError:
+				pass
+			return out
+		#* Always use the colors of the loaded theme, a meter created before a theme change can't put old colors in the cache
+		self.color_gradient = THEME.gradient[self.gradient_name]
+		self.color_inactive = THEME.meter_bg
+		out = ""
 		for i in range(1, self.width + 1):
 			if value >= round(i * 100 / self.width):
 				out += f'{self.color_gradient[round(i * 100 / self.width) if not self.invert else round(100 - (i * 100 / self.width))]}{Symbol.meter}'
@@ -1518,8 +2385,12 @@ class Meter:
 				break
 		else:
 			out += f'{Term.fg}'
-		if not value in self.saved:
-			self.saved[value] = out
+		self.cache[key] = out
+		while len(self.cache) > self.cache_size:
+			try:
+				self.cache.popitem(last=False) # type: ignore
+			except KeyError:
+				break
 		return out
 
 class Meters:
@@ -1537,8 +2408,8 @@ class Box:
 	width_p: int
 	x: int
 	y: int
-	width: int
-	height: int
+	width: int = 0
+	height: int = 0
 	proc_mode: bool = True if (CONFIG.view_mode == "proc" and not ARG_MODE) or ARG_MODE == "proc" else False
 	stat_mode: bool = True if (CONFIG.view_mode == "stat" and not ARG_MODE) or ARG_MODE == "stat" else False
 	out: str
@@ -1564,14 +2435,16 @@ class Box:
 		for sub in cls.__subclasses__():
 			sub._calc_size() # type: ignore
 			sub.resized = True # type: ignore
+		for collector in Collector.__subclasses__():
+			collector.deadline = 0.0 #* Resized boxes needs all collectors to run and redraw on the next update
 
 	@classmethod
 	def draw_update_ms(cls, now: bool = True):
 		update_string: str = f'{CONFIG.update_ms}ms'
 		xpos: int = CpuBox.x + CpuBox.width - len(update_string) - 15
 		if not "+" in Key.mouse:
-			Key.mouse["+"] = [[xpos + 7 + i, CpuBox.y] for i in range(3)]
-			Key.mouse["-"] = [[CpuBox.x + CpuBox.width - 4 + i, CpuBox.y] for i in range(3)]
+			Key.mouse_add("+", xpos + 7, CpuBox.y, 3, box="update_ms")
+			Key.mouse_add("-", CpuBox.x + CpuBox.width - 4, CpuBox.y, 3, box="update_ms")
 		Draw.buffer("update_ms!" if now and not Menu.active else "update_ms",
 			f'{Mv.to(CpuBox.y, xpos)}{THEME.cpu_box(Symbol.h_line * 7, Symbol.title_left)}{Fx.b}{THEME.hi_fg("+")} ',
 			f'{THEME.title(update_string)} {THEME.hi_fg("-")}{Fx.ub}{THEME.cpu_box(Symbol.title_right)}', only_save=Menu.active, once=True)
@@ -1669,7 +2542,7 @@ class CpuBox(Box, SubBox):
 	@classmethod
 	def _draw_bg(cls) -> str:
 		if not "M" in Key.mouse:
-			Key.mouse["M"] = [[cls.x + 10 + i, cls.y] for i in range(6)]
+			Key.mouse_add("M", cls.x + 10, cls.y, 6, box="bg")
 		return (f'{create_box(box=cls, line_color=THEME.cpu_box)}'
 		f'{Mv.to(cls.y, cls.x + 10)}{THEME.cpu_box(Symbol.title_left)}{Fx.b}{THEME.hi_fg("M")}{THEME.title("enu")}{Fx.ub}{THEME.cpu_box(Symbol.title_right)}'
 		f'{create_box(x=cls.box_x, y=cls.box_y, width=cls.box_width, height=cls.box_height, line_color=THEME.div_line, fill=False, title=CPU_NAME[:cls.box_width - 14] if not CONFIG.custom_cpu_name else CONFIG.custom_cpu_name[:cls.box_width - 14])}')
@@ -1731,19 +2604,15 @@ class CpuBox(Box, SubBox):
 
 		if cls.resized or cls.redraw:
 			if not "m" in Key.mouse:
-				Key.mouse["m"] = [[cls.x + 16 + i, cls.y] for i in range(12)]
+				Key.mouse_add("m", cls.x + 16, cls.y, 12, box="cpu_misc")
 			out_misc += f'{Mv.to(cls.y, cls.x + 16)}{THEME.cpu_box(Symbol.title_left)}{Fx.b}{THEME.hi_fg("m")}{THEME.title}ode:{ARG_MODE or CONFIG.view_mode}{Fx.ub}{THEME.cpu_box(Symbol.title_right)}'
 			Graphs.cpu["up"] = Graph(w - bw - 3, hh, THEME.gradient["cpu"], cpu.cpu_usage[0])
 			Graphs.cpu["down"] = Graph(w - bw - 3, h - hh, THEME.gradient["cpu"], cpu.cpu_usage[0], invert=True)
 			Meters.cpu = Meter(cpu.cpu_usage[0][-1], bw - (21 if cpu.got_sensors else 9), "cpu")
 			if cls.column_size > 0:
-				for n in range(THREADS):
-					Graphs.cores[n] = Graph(5 * cls.column_size, 1, None, cpu.cpu_usage[n + 1])
+				Graphs.cores = Graph.batch(5 * cls.column_size, 1, None, cpu.cpu_usage[1:THREADS + 1])
 			if cpu.got_sensors:
-				Graphs.temps[0] = Graph(5, 1, None, cpu.cpu_temp[0], max_value=cpu.cpu_temp_crit, offset=-23)
-				if cls.column_size > 1:
-					for n in range(1, THREADS + 1):
-						Graphs.temps[n] = Graph(5, 1, None, cpu.cpu_temp[n], max_value=cpu.cpu_temp_crit, offset=-23)
+				Graphs.temps[:THREADS + 1 if cls.column_size > 1 else 1] = Graph.batch(5, 1, None, cpu.cpu_temp[:THREADS + 1 if cls.column_size > 1 else 1], max_value=cpu.cpu_temp_crit, offset=-23)
 			Draw.buffer("cpu_misc", out_misc, only_save=True)
 
 		if CONFIG.show_battery and cls.battery_activity():
@@ -1949,12 +2818,12 @@ class MemBox(Box):
 					if len(mem.disks) * 3 <= h + 1:
 						Meters.disks_free[name] = Meter(mem.disks[name]["free_percent"], cls.disk_meter, "free")
 			if not "g" in Key.mouse:
-				Key.mouse["g"] = [[x + cls.mem_width - 8 + i, y-1] for i in range(5)]
+				Key.mouse_add("g", x + cls.mem_width - 8, y-1, 5, box="mem_misc")
 			out_misc += (f'{Mv.to(y-1, x + cls.mem_width - 9)}{THEME.mem_box(Symbol.title_left)}{Fx.b if CONFIG.mem_graphs else ""}'
 				f'{THEME.hi_fg("g")}{THEME.title("raph")}{Fx.ub}{THEME.mem_box(Symbol.title_right)}')
 			if CONFIG.show_disks:
 				if not "s" in Key.mouse:
-					Key.mouse["s"] = [[x + w - 6 + i, y-1] for i in range(4)]
+					Key.mouse_add("s", x + w - 6, y-1, 4, box="mem_misc")
 				out_misc += (f'{Mv.to(y-1, x + w - 7)}{THEME.mem_box(Symbol.title_left)}{Fx.b if CONFIG.swap_disk else ""}'
 				f'{THEME.hi_fg("s")}{THEME.title("wap")}{Fx.ub}{THEME.mem_box(Symbol.title_right)}')
 
@@ -2010,7 +2879,7 @@ class MemBox(Box):
 					if not name in Meters.disks_used:
 						continue
 					if cy > h - 2: break
-					out += Fx.trans(f'{Mv.to(y+cy, x+cx)}{gli}{THEME.title}{Fx.b}{item["name"]:{cls.disks_width - 2}.12}{Mv.to(y+cy, x + cx + cls.disks_width - 11)}{item["total"][:None if big_disk else -2]:>9}')
+					out += Fx.trans(f'{Mv.to(y+cy, x+cx)}{gli}{THEME.inactive_fg if item["stale"] else THEME.title}{Fx.b}{item["name"]:{cls.disks_width - 2}.12}{Mv.to(y+cy, x + cx + cls.disks_width - 11)}{item["total"][:None if big_disk else -2]:>9}')
 					out += f'{Mv.to(y+cy, x + cx + (cls.disks_width // 2) - (len(item["io"]) // 2) - 2)}{Fx.ub}{THEME.main_fg}{item["io"]}{Fx.ub}{THEME.main_fg}{Mv.to(y+cy+1, x+cx)}'
 					out += f'Used:{str(item["used_percent"]) + "%":>4} ' if big_disk else "U "
 					out += f'{Meters.disks_used[name]}{item["used"][:None if big_disk else -2]:>{9 if big_disk else 7}}'
@@ -2080,21 +2949,21 @@ class NetBox(Box, SubBox):
 
 		if cls.resized or cls.redraw:
 			out_misc += cls._draw_bg()
-			if not "b" in Key.mouse:
-				Key.mouse["b"] = [[x+w - len(net.nic[:10]) - 9 + i, y-1] for i in range(4)]
-				Key.mouse["n"] = [[x+w - 5 + i, y-1] for i in range(4)]
-				Key.mouse["z"] = [[x+w - len(net.nic[:10]) - 14 + i, y-1] for i in range(4)]
+			Key.mouse_clear("net_misc")
+			Key.mouse_add("b", x+w - len(net.nic[:10]) - 9, y-1, 4, box="net_misc")
+			Key.mouse_add("n", x+w - 5, y-1, 4, box="net_misc")
+			Key.mouse_add("z", x+w - len(net.nic[:10]) - 14, y-1, 4, box="net_misc")
 
 
 			out_misc += (f'{Mv.to(y-1, x+w - 25)}{THEME.net_box}{Symbol.h_line * (10 - len(net.nic[:10]))}{Symbol.title_left}{Fx.b if reset else ""}{THEME.hi_fg("z")}{THEME.title("ero")}'
 				f'{Fx.ub}{THEME.net_box(Symbol.title_right)}{Term.fg}'
 				f'{THEME.net_box}{Symbol.title_left}{Fx.b}{THEME.hi_fg("<b")} {THEME.title(net.nic[:10])} {THEME.hi_fg("n>")}{Fx.ub}{THEME.net_box(Symbol.title_right)}{Term.fg}')
 			if w - len(net.nic[:10]) - 20 > 6:
-				if not "a" in Key.mouse: Key.mouse["a"] = [[x+w - 20 - len(net.nic[:10]) + i, y-1] for i in range(4)]
+				Key.mouse_add("a", x+w - 20 - len(net.nic[:10]), y-1, 4, box="net_misc")
 				out_misc += (f'{Mv.to(y-1, x+w - 21 - len(net.nic[:10]))}{THEME.net_box(Symbol.title_left)}{Fx.b if net.auto_min else ""}{THEME.hi_fg("a")}{THEME.title("uto")}'
 				f'{Fx.ub}{THEME.net_box(Symbol.title_right)}{Term.fg}')
 			if w - len(net.nic[:10]) - 20 > 13:
-				if not "y" in Key.mouse: Key.mouse["y"] = [[x+w - 26 - len(net.nic[:10]) + i, y-1] for i in range(4)]
+				Key.mouse_add("y", x+w - 26 - len(net.nic[:10]), y-1, 4, box="net_misc")
 				out_misc += (f'{Mv.to(y-1, x+w - 27 - len(net.nic[:10]))}{THEME.net_box(Symbol.title_left)}{Fx.b if CONFIG.net_sync else ""}{THEME.title("s")}{THEME.hi_fg("y")}{THEME.title("nc")}'
 				f'{Fx.ub}{THEME.net_box(Symbol.title_right)}{Term.fg}')
 			Draw.buffer("net_misc", out_misc, only_save=True)
@@ -2239,7 +3108,11 @@ class ProcBox(Box):
 
 		if old != (cls.start, cls.selected):
 			cls.moved = True
-			Collector.collect(ProcCollector, proc_interrupt=True, redraw=True, only_draw=True)
+			if len(ProcCollector.processes) < ProcCollector.num_procs and cls.start - 1 + cls.select_max > len(ProcCollector.processes):
+				ProcCollector.extend = True
+				Collector.collect(ProcCollector, proc_interrupt=True, redraw=True)
+			else:
+				Collector.collect(ProcCollector, proc_interrupt=True, redraw=True, only_draw=True)
 
 
 	@classmethod
@@ -2299,8 +3172,7 @@ class ProcBox(Box):
 			s_len += len(CONFIG.proc_sorting)
 			if cls.resized or s_len != cls.s_len or proc.detailed:
 				cls.s_len = s_len
-				for k in ["e", "r", "c", "t", "k", "i", "enter", "left", " ", "f", "delete"]:
-					if k in Key.mouse: del Key.mouse[k]
+				Key.mouse_clear("proc_misc")
 			if proc.detailed:
 				killed = proc.details["killed"]
 				main = THEME.main_fg if cls.selected == 0 and not killed else THEME.inactive_fg
@@ -2321,17 +3193,17 @@ class ProcBox(Box):
 					f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{THEME.title(proc.details["name"][:(dgw - 11)])}{Fx.ub}{THEME.proc_box(Symbol.title_right)}')
 
 				if cls.selected == 0:
-					Key.mouse["enter"] = [[dx+dw-10 + i, dy-1] for i in range(7)]
+					Key.mouse_add("enter", dx+dw-10, dy-1, 7, box="proc_misc")
 				if cls.selected == 0 and not killed:
-					Key.mouse["t"] = [[dx+2 + i, dy-1] for i in range(9)]
+					Key.mouse_add("t", dx+2, dy-1, 9, box="proc_misc")
 
 				out_misc += (f'{Mv.to(dy-1, dx+dw - 11)}{THEME.proc_box(Symbol.title_left)}{Fx.b}{title if cls.selected > 0 else THEME.title}close{Fx.ub} {main if cls.selected > 0 else THEME.main_fg}{Symbol.enter}{THEME.proc_box(Symbol.title_right)}'
 					f'{Mv.to(dy-1, dx+1)}{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}t{title}erminate{Fx.ub}{THEME.proc_box(Symbol.title_right)}')
 				if dw > 28:
-					if cls.selected == 0 and not killed and not "k" in Key.mouse: Key.mouse["k"] = [[dx + 13 + i, dy-1] for i in range(4)]
+					if cls.selected == 0 and not killed and not "k" in Key.mouse: Key.mouse_add("k", dx + 13, dy-1, 4, box="proc_misc")
 					out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}k{title}ill{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 				if dw > 39:
-					if cls.selected == 0 and not killed and not "i" in Key.mouse: Key.mouse["i"] = [[dx + 19 + i, dy-1] for i in range(9)]
+					if cls.selected == 0 and not killed and not "i" in Key.mouse: Key.mouse_add("i", dx + 19, dy-1, 9, box="proc_misc")
 					out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}i{title}nterrupt{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 
 				if Graphs.detailed_cpu is NotImplemented or cls.resized:
@@ -2355,8 +3227,8 @@ class ProcBox(Box):
 
 			sort_pos = x + w - len(CONFIG.proc_sorting) - 7
 			if not "left" in Key.mouse:
-				Key.mouse["left"] = [[sort_pos + i, y-1] for i in range(3)]
-				Key.mouse["right"] = [[sort_pos + len(CONFIG.proc_sorting) + 3 + i, y-1] for i in range(3)]
+				Key.mouse_add("left", sort_pos, y-1, 3, box="proc_misc")
+				Key.mouse_add("right", sort_pos + len(CONFIG.proc_sorting) + 3, y-1, 3, box="proc_misc")
 
 
 			out_misc += (f'{Mv.to(y-1, x + 8)}{THEME.proc_box(Symbol.h_line * (w - 9))}' +
@@ -2366,23 +3238,23 @@ class ProcBox(Box):
 
 
 			if w > 29 + s_len:
-				if not "e" in Key.mouse: Key.mouse["e"] = [[sort_pos - 5 + i, y-1] for i in range(4)]
+				if not "e" in Key.mouse: Key.mouse_add("e", sort_pos - 5, y-1, 4, box="proc_misc")
 				out_misc += (f'{Mv.to(y-1, sort_pos - 6)}{THEME.proc_box(Symbol.title_left)}{Fx.b if CONFIG.proc_tree else ""}'
 					f'{THEME.title("tre")}{THEME.hi_fg("e")}{Fx.ub}{THEME.proc_box(Symbol.title_right)}')
 			if w > 37 + s_len:
-				if not "r" in Key.mouse: Key.mouse["r"] = [[sort_pos - 14 + i, y-1] for i in range(7)]
+				if not "r" in Key.mouse: Key.mouse_add("r", sort_pos - 14, y-1, 7, box="proc_misc")
 				out_misc += (f'{Mv.to(y-1, sort_pos - 15)}{THEME.proc_box(Symbol.title_left)}{Fx.b if CONFIG.proc_reversed else ""}'
 					f'{THEME.hi_fg("r")}{THEME.title("everse")}{Fx.ub}{THEME.proc_box(Symbol.title_right)}')
 			if w > 47 + s_len:
-				if not "c" in Key.mouse: Key.mouse["c"] = [[sort_pos - 24 + i, y-1] for i in range(8)]
+				if not "c" in Key.mouse: Key.mouse_add("c", sort_pos - 24, y-1, 8, box="proc_misc")
 				out_misc += (f'{Mv.to(y-1, sort_pos - 25)}{THEME.proc_box(Symbol.title_left)}{Fx.b if CONFIG.proc_per_core else ""}'
 					f'{THEME.title("per-")}{THEME.hi_fg("c")}{THEME.title("ore")}{Fx.ub}{THEME.proc_box(Symbol.title_right)}')
 
-			if not "f" in Key.mouse or cls.resized: Key.mouse["f"] = [[x+5 + i, y-1] for i in range(6 if not proc.search_filter else 2 + len(proc.search_filter[-10:]))]
+			if not "f" in Key.mouse or cls.resized: Key.mouse_add("f", x+5, y-1, 6 if not proc.search_filter else 2 + len(proc.search_filter[-10:]), box="proc_misc")
 			if proc.search_filter:
-				if not "delete" in Key.mouse: Key.mouse["delete"] = [[x+11 + len(proc.search_filter[-10:]) + i, y-1] for i in range(3)]
+				if not "delete" in Key.mouse: Key.mouse_add("delete", x+11 + len(proc.search_filter[-10:]), y-1, 3, box="proc_misc")
 			elif "delete" in Key.mouse:
-				del Key.mouse["delete"]
+				Key.mouse_del("delete")
 			out_misc += (f'{Mv.to(y-1, x + 7)}{THEME.proc_box(Symbol.title_left)}{Fx.b if cls.filtering or proc.search_filter else ""}{THEME.hi_fg("f")}{THEME.title}' +
 				("ilter" if not proc.search_filter and not cls.filtering else f' {proc.search_filter[-(10 if w < 83 else w - 74):]}{(Fx.bl + "█" + Fx.ubl) if cls.filtering else THEME.hi_fg(" del")}') +
 				f'{THEME.proc_box(Symbol.title_right)}')
@@ -2394,18 +3266,18 @@ class ProcBox(Box):
 					f'{Mv.to(y+h, x+1)}{THEME.proc_box(Symbol.title_left)}{main}{Symbol.up} {Fx.b}{THEME.main_fg("select")} {Fx.ub}'
 					f'{THEME.inactive_fg if cls.selected == cls.select_max else THEME.main_fg}{Symbol.down}{THEME.proc_box(Symbol.title_right)}'
 					f'{THEME.proc_box(Symbol.title_left)}{title}{Fx.b}info {Fx.ub}{main}{Symbol.enter}{THEME.proc_box(Symbol.title_right)}')
-			if not "enter" in Key.mouse: Key.mouse["enter"] = [[x + 14 + i, y+h] for i in range(6)]
+			if not "enter" in Key.mouse: Key.mouse_add("enter", x + 14, y+h, 6, box="proc_misc")
 			if w - len(loc_string) > 34:
-				if not "t" in Key.mouse: Key.mouse["t"] = [[x + 22 + i, y+h] for i in range(9)]
+				if not "t" in Key.mouse: Key.mouse_add("t", x + 22, y+h, 9, box="proc_misc")
 				out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}t{title}erminate{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 			if w - len(loc_string) > 40:
-				if not "k" in Key.mouse: Key.mouse["k"] = [[x + 33 + i, y+h] for i in range(4)]
+				if not "k" in Key.mouse: Key.mouse_add("k", x + 33, y+h, 4, box="proc_misc")
 				out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}k{title}ill{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 			if w - len(loc_string) > 51:
-				if not "i" in Key.mouse: Key.mouse["i"] = [[x + 39 + i, y+h] for i in range(9)]
+				if not "i" in Key.mouse: Key.mouse_add("i", x + 39, y+h, 9, box="proc_misc")
 				out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}i{title}nterrupt{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 			if CONFIG.proc_tree and w - len(loc_string) > 65:
-				if not " " in Key.mouse: Key.mouse[" "] = [[x + 50 + i, y+h] for i in range(12)]
+				if not " " in Key.mouse: Key.mouse_add(" ", x + 50, y+h, 12, box="proc_misc")
 				out_misc += f'{THEME.proc_box(Symbol.title_left)}{Fx.b}{hi}spc {title}collapse{Fx.ub}{THEME.proc_box(Symbol.title_right)}'
 
 			#* Processes labels
@@ -2469,6 +3341,11 @@ class ProcBox(Box):
 		elif cls.selected > cls.select_max: cls.selected = cls.select_max
 		if cls.selected < 0: cls.selected = 0
 
+		#* Resolve theme escapes once for all process rows
+		main_fg, inactive_fg = THEME.main_fg.escape, THEME.inactive_fg.escape
+		proc_fade, process_gradient, proc_gradient = THEME.proc_fade, THEME.gradient["process"], THEME.gradient["proc"]
+		graph_bg = f'{inactive_fg}{"⡀"*5}{main_fg}'
+
 		#* Start iteration over all processes and info
 		cy = 1
 		for n, (pid, items) in enumerate(proc.processes.items(), start=1):
@@ -2505,7 +3382,7 @@ class ProcBox(Box):
 				else:
 					cls.pid_counter[pid] = 0
 
-			end = f'{THEME.main_fg}{Fx.ub}' if CONFIG.proc_colors else Fx.ub
+			end = f'{main_fg}{Fx.ub}' if CONFIG.proc_colors else Fx.ub
 			if cls.selected > cy: calc = cls.selected - cy
 			elif cls.selected > 0 and cls.selected <= cy: calc = cy - cls.selected
 			else: calc = cy
@@ -2513,15 +3390,14 @@ class ProcBox(Box):
 				vals = []
 				for v in [int(cpu), int(mem), int(threads // 3)]:
 					if CONFIG.proc_gradient:
-						val = ((v if v <= 100 else 100) + 100) - calc * 100 // cls.select_max
-						vals += [f'{THEME.gradient["proc_color" if val < 100 else "process"][val if val < 100 else val - 100]}']
+						vals += [proc_fade[((v if v <= 100 else 100) + 100) - calc * 100 // cls.select_max]]
 					else:
-						vals += [f'{THEME.gradient["process"][v if v <= 100 else 100]}']
+						vals += [process_gradient[v if v <= 100 else 100]]
 				c_color, m_color, t_color = vals
 			else:
 				c_color = m_color = t_color = Fx.b
 			if CONFIG.proc_gradient and not is_selected:
-				g_color = f'{THEME.gradient["proc"][calc * 100 // cls.select_max]}'
+				g_color = proc_gradient[calc * 100 // cls.select_max]
 			if is_selected:
 				c_color = m_color = t_color = g_color = end = ""
 				out += f'{THEME.selected_bg}{THEME.selected_fg}{Fx.b}'
@@ -2533,12 +3409,12 @@ class ProcBox(Box):
 				(t_color + (f'{threads:>4} ' if threads < 1000 else "999> ") + end if tr_show else "") +
 				(g_color + (f'{username:<9.9}' if len(username) < 10 else f'{username[:8]:<8}+') if usr_show else "") +
 				m_color + ((f'{mem:>4.1f}' if mem < 100 else f'{mem:>4.0f} ') if not CONFIG.proc_mem_bytes else f'{floating_humanizer(mem_b, short=True):>4.4}') + end +
-				f' {THEME.inactive_fg}{"⡀"*5}{THEME.main_fg}{g_color}{c_color}' + (f' {cpu:>4.1f} ' if cpu < 100 else f'{cpu:>5.0f} ') + end +
+				f' {graph_bg}{g_color}{c_color}' + (f' {cpu:>4.1f} ' if cpu < 100 else f'{cpu:>5.0f} ') + end +
 				(" " if proc.num_procs > cls.select_max else ""))
 
 			#* Draw small cpu graph for process if cpu usage was above 1% in the last 10 updates
 			if pid in Graphs.pid_cpu:
-				out += f'{Mv.to(y+cy, x + w - (12 if proc.num_procs > cls.select_max else 11))}{c_color if CONFIG.proc_colors else THEME.proc_misc}{Graphs.pid_cpu[pid](None if cls.moved else round(cpu))}{THEME.main_fg}'
+				out += f'{Mv.to(y+cy, x + w - (12 if proc.num_procs > cls.select_max else 11))}{c_color if CONFIG.proc_colors else THEME.proc_misc}{Graphs.pid_cpu[pid](None if cls.moved else round(cpu))}{main_fg}'
 
 			if is_selected: out += f'{Fx.ub}{Term.fg}{Term.bg}{Mv.to(y+cy, x + w - 1)}{" " if proc.num_procs > cls.select_max else ""}'
 
@@ -2550,16 +3426,16 @@ class ProcBox(Box):
 
 		#* Draw scrollbar if needed
 		if proc.num_procs > cls.select_max:
-			if cls.resized:
-				Key.mouse["mouse_scroll_up"] = [[x+w-2+i, y] for i in range(3)]
-				Key.mouse["mouse_scroll_down"] = [[x+w-2+i, y+h-1] for i in range(3)]
+			if cls.resized or not "mouse_scroll_up" in Key.mouse:
+				Key.mouse_add("mouse_scroll_up", x+w-2, y, 3, box="proc")
+				Key.mouse_add("mouse_scroll_down", x+w-2, y+h-1, 3, box="proc")
 			scroll_pos = round(cls.start * (cls.select_max - 2) / (proc.num_procs - (cls.select_max - 2)))
 			if scroll_pos < 0 or cls.start == 1: scroll_pos = 0
 			elif scroll_pos > h - 3 or cls.start >= proc.num_procs - cls.select_max: scroll_pos = h - 3
 			out += (f'{Mv.to(y, x+w-1)}{Fx.b}{THEME.main_fg}↑{Mv.to(y+h-1, x+w-1)}↓{Fx.ub}'
 					f'{Mv.to(y+1+scroll_pos, x+w-1)}█')
-		elif "scroll_up" in Key.mouse:
-			del Key.mouse["scroll_up"], Key.mouse["scroll_down"]
+		elif "mouse_scroll_up" in Key.mouse:
+			Key.mouse_clear("proc")
 
 		#* Draw current selection and number of processes
 		out += (f'{Mv.to(y+h, x + w - 3 - len(loc_string))}{THEME.proc_box}{Symbol.title_left}{THEME.title}'
@@ -2576,17 +3452,61 @@ class ProcBox(Box):
 		Draw.buffer(cls.buffer, f'{out_misc}{out}{Term.fg}', only_save=Menu.active)
 		cls.redraw = cls.resized = cls.moved = False
 
+class WorkerPool:
+	'''Runs functions in daemon worker threads, a worker stuck in a hung call never delays quitting
+	* .submit(function, *args) : Queue a call and return a Future for its result
+	* Workers are started on demand while there are fewer idle workers than queued calls, up to max_workers
+	'''
+	name: str
+	max_workers: int
+	jobs: Queue
+	lock: threading.Lock
+	workers: int
+	idle: int
+
+	def __init__(self, name: str, max_workers: int):
+		self.name = name
+		self.max_workers = max_workers
+		self.jobs = Queue()
+		self.lock = threading.Lock()
+		self.workers = self.idle = 0
+
+	def submit(self, function: Callable, *args) -> Future:
+		future: Future = Future()
+		with self.lock:
+			self.jobs.put((future, function, args))
+			if self.idle < self.jobs.qsize() and self.workers < self.max_workers:
+				self.workers += 1
+				threading.Thread(target=self._worker, name=self.name, daemon=True).start()
+		return future
+
+	def _worker(self):
+		future: Future
+		while True:
+			with self.lock: self.idle += 1
+			future, function, args = self.jobs.get()
+			with self.lock: self.idle -= 1
+			if not future.set_running_or_notify_cancel(): continue
+			try:
+				future.set_result(function(*args))
+			except Exception as e:
+				future.set_exception(e)
+
 class Collector:
 	'''Data collector master class
 	* .start(): Starts collector thread
 	* .stop(): Stops collector thread
-	* .collect(*collectors: Collector, draw_now: bool = True, interrupt: bool = False): queues up collectors to run'''
+	* .collect(*collectors: Collector, draw_now: bool = True, interrupt: bool = False): queues up collectors to run
+	* Collectors are run concurrently in .pool before drawing if CONFIG.parallel_collect is set, collectors not done within one tick keep
+	* running in the background and their boxes keep the last drawn data until they finish'''
 	stopping: bool = False
 	started: bool = False
 	draw_now: bool = False
 	redraw: bool = False
 	only_draw: bool = False
 	thread: threading.Thread
+	pool: WorkerPool = WorkerPool("collector", 8)
+	job: Optional[Future] = None
 	collect_run = threading.Event()
 	collect_idle = threading.Event()
 	collect_idle.set()
@@ -2595,6 +3515,8 @@ class Collector:
 	collect_interrupt: bool = False
 	proc_interrupt: bool = False
 	use_draw_list: bool = False
+	interval_key: str = ""
+	deadline: float = 0.0
 
 	@classmethod
 	def start(cls):
@@ -2620,10 +3542,12 @@ class Collector:
 	def _runner(cls):
 		'''This is meant to run in it's own thread, collecting and drawing when collect_run is set'''
 		draw_buffers: List[str] = []
+		draw_start: float = 0.0
 		debugged: bool = False
+		parallel: bool = False
 		try:
 			while not cls.stopping:
-				if CONFIG.draw_clock: Box.draw_clock()
+				if CONFIG.draw_clock and not HEADLESS: Box.draw_clock()
 				cls.collect_run.wait(0.1)
 				if not cls.collect_run.is_set():
 					continue
@@ -2633,17 +3557,27 @@ class Collector:
 				cls.collect_idle.clear()
 				cls.collect_done.clear()
 				if DEBUG and not debugged: TimeIt.start("Collect and draw")
+				parallel = CONFIG.parallel_collect and not cls.only_draw and len(cls.collect_queue) > 1
+				if parallel:
+					cls.collect_queue = cls._collect_parallel(cls.collect_queue)
 				while cls.collect_queue:
 					collector = cls.collect_queue.pop()
-					if not cls.only_draw:
+					if not cls.only_draw and not parallel and (collector.job is None or collector.job.done()): #* Else still collecting in the background from an earlier parallel run
 						collector._collect()
+					if HEADLESS: continue
+					draw_start = time()
 					collector._draw()
+					FrameStats.render(collector.buffer, time() - draw_start)
 					if cls.use_draw_list: draw_buffers.append(collector.buffer)
 					if cls.collect_interrupt: break
 				if DEBUG and not debugged: TimeIt.stop("Collect and draw"); debugged = True
-				if cls.draw_now and not Menu.active and not cls.collect_interrupt:
+				if cls.draw_now and not HEADLESS and not Menu.active and not cls.collect_interrupt:
+					if FrameStats.overlay:
+						FrameStats.draw()
+						draw_buffers.append("frame_stats")
 					if cls.use_draw_list: Draw.out(*draw_buffers)
 					else: Draw.out()
+					FrameStats.report()
 				cls.collect_idle.set()
 				cls.collect_done.set()
 		except Exception as e:
@@ -2652,6 +3586,25 @@ class Collector:
 			cls.collect_done.set()
 			clean_quit(1, thread=True)
 
+	@classmethod
+	def _collect_parallel(cls, collectors: List) -> List:
+		'''Run _collect() for all given collectors at the same time in the worker pool and wait up to one tick or until interrupted,
+		returns all collectors for drawing, the ones still collecting are drawn with their last data'''
+		started: Set[Future] = set()
+		for collector in collectors:
+			if collector.job is None or collector.job.done(): #* Not started again while the last run is still going
+				collector.job = cls.pool.submit(collector._collect)
+				started.add(collector.job)
+		deadline: float = time() + Collector.tick()
+		while started and not cls.collect_interrupt and time() < deadline:
+			started = wait(started, timeout=min(deadline - time(), 0.05)).not_done
+		for collector in collectors:
+			if not collector.job.done():
+				if not cls.collect_interrupt: errlog.debug(f'{collector.__name__} still collecting after {Collector.tick()}s, drawing last data')
+				continue
+			collector.job.result() #* Reraises any exception from the collector in the runner thread
+		return collectors
+
 	@classmethod
 	def collect(cls, *collectors, draw_now: bool = True, interrupt: bool = False, proc_interrupt: bool = False, redraw: bool = False, only_draw: bool = False):
 		'''Setup collect queue for _runner'''
@@ -2670,25 +3623,46 @@ class Collector:
 			cls.use_draw_list = True
 
 		else:
-			cls.collect_queue = list(cls.__subclasses__())
+			now: float = time()
+			cls.collect_queue = [collector for collector in cls.__subclasses__() if redraw or only_draw or cls.due(collector.deadline, now)]
+			if not cls.collect_queue: return
+			for collector in cls.collect_queue:
+				collector.deadline = now + collector.interval()
+			cls.use_draw_list = len(cls.collect_queue) < len(cls.__subclasses__())
 
 		cls.collect_run.set()
 
+	@classmethod
+	def interval(cls, key: str = "") -> float:
+		'''Returns update interval in seconds from config key, defaults to the collectors interval_key, 0 or unset follows update_ms'''
+		return (getattr(CONFIG, key or cls.interval_key, 0) or CONFIG.update_ms) / 1000
+
+	@classmethod
+	def tick(cls) -> float:
+		'''Returns the shortest update interval of all collectors in seconds, used by Timer for the main loop'''
+		return min(collector.interval() for collector in Collector.__subclasses__())
+
+	@classmethod
+	def due(cls, deadline: float, now: float) -> bool:
+		'''Returns True if deadline has passed or is less than half a tick away, so timer jitter doesn't skip a whole tick'''
+		return deadline - now <= Collector.tick() / 2
+
 
 class CpuCollector(Collector):
 	'''Collects cpu usage for cpu and cores, cpu frequency, load_avg, uptime and cpu temps'''
-	cpu_usage: List[List[int]] = []
-	cpu_temp: List[List[int]] = []
+	cpu_usage: List[RingBuffer] = []
+	cpu_temp: List[RingBuffer] = []
 	cpu_temp_high: int = 0
 	cpu_temp_crit: int = 0
 	for _ in range(THREADS + 1):
-		cpu_usage.append([])
-		cpu_temp.append([])
+		cpu_usage.append(RingBuffer(Term.width * 2, "B"))
+		cpu_temp.append(RingBuffer(5, "i"))
 	freq_error: bool = False
 	cpu_freq: int = 0
 	load_avg: List[float] = []
 	uptime: str = ""
 	buffer: str = CpuBox.buffer
+	interval_key: str = "cpu_update_ms"
 	sensor_method: str = ""
 	got_sensors: bool = False
 
@@ -2727,12 +3701,14 @@ class CpuCollector(Collector):
 
 	@classmethod
 	def _collect(cls):
+		cores: List[int] = []
+		for usage in cls.cpu_usage:
+			usage.resize(Term.width * 2)
 		cls.cpu_usage[0].append(round(psutil.cpu_percent(percpu=False)))
 
 		for n, thread in enumerate(psutil.cpu_percent(percpu=True), start=1):
-			cls.cpu_usage[n].append(round(thread))
-			if len(cls.cpu_usage[n]) > Term.width * 2:
-				del cls.cpu_usage[n][0]
+			cores.append(round(thread))
+			cls.cpu_usage[n].append(cores[-1])
 		try:
 			if hasattr(psutil.cpu_freq(), "current"):
 				cls.cpu_freq = round(psutil.cpu_freq().current)
@@ -2749,8 +3725,7 @@ class CpuCollector(Collector):
 		if CONFIG.check_temp and cls.got_sensors:
 			cls._collect_temps()
 
-		report(cpu_usage=cls.cpu_usage[0][-1])
-
+		report("cpu", cpu_usage=cls.cpu_usage[0][-1], cores=cores)
 
 	@classmethod
 	def _collect_temps(cls):
@@ -2826,7 +3801,7 @@ class CpuCollector(Collector):
 					errlog.exception(f'{e}')
 					cls.got_sensors = False
 					#CONFIG.check_temp = False
-					CpuBox._calc_size()
+					if not HEADLESS: CpuBox._calc_size()
 
 		else:
 			try:
@@ -2864,36 +3839,79 @@ class CpuCollector(Collector):
 			except Exception as e:
 					errlog.exception(f'{e}')
 					cls.got_sensors = False
-					CpuBox._calc_size()
+					if not HEADLESS: CpuBox._calc_size()
 			else:
 				if not cores:
 					for n in range(THREADS + 1):
 						cls.cpu_temp[n].append(temp)
 
-		if len(cls.cpu_temp[0]) > 5:
-			for n in range(len(cls.cpu_temp)):
-				del cls.cpu_temp[n][0]
 
 	@classmethod
 	def _draw(cls):
 		CpuBox._draw_fg()
 
 
+class DiskUsage:
+	'''Runs psutil.disk_usage() in a pool of daemon worker threads so a hung network mount can't block the collector
+	* .probe(mountpoints, interval) : Start a probe of each mountpoint and wait up to .timeout seconds for them, unfinished probes keep running
+	* .usage[mountpoint] : Last known usage or None, .stale[mountpoint] : True if the last probe failed or hasn't finished in time
+	* A mountpoint isn't probed again while its last probe is running, timed out mountpoints are backed off from 2 intervals doubling up to 5 minutes
+	* Probes run in a WorkerPool of daemon threads, a worker stuck in a hung mount doesn't delay quitting
+	'''
+	timeout: float = 0.5
+	max_backoff: float = 300.0
+	pool: WorkerPool = WorkerPool("disk_usage", 16)
+	pending: Dict[str, Future] = {}
+	usage: Dict[str, Any] = {}
+	stale: Dict[str, bool] = {}
+	timeouts: Dict[str, int] = {}
+	retry: Dict[str, float] = {}
+
+	@classmethod
+	def probe(cls, mountpoints: List[str], interval: float):
+		now: float = time()
+		started: List[Future] = []
+		for mountpoint in mountpoints:
+			if mountpoint in cls.pending or now < cls.retry.get(mountpoint, 0): continue
+			cls.pending[mountpoint] = cls.pool.submit(psutil.disk_usage, mountpoint)
+			started.append(cls.pending[mountpoint])
+		if started: wait(started, timeout=cls.timeout)
+
+		for mountpoint in mountpoints:
+			cls.usage.setdefault(mountpoint, None)
+			if mountpoint not in cls.pending: continue
+			future: Future = cls.pending[mountpoint]
+			if future.done():
+				del cls.pending[mountpoint]
+				try:
+					cls.usage[mountpoint] = future.result()
+				except Exception:
+					cls.stale[mountpoint] = True
+				else:
+					cls.stale[mountpoint] = False
+					cls.timeouts[mountpoint] = 0
+			elif future in started:
+				cls.stale[mountpoint] = True
+				if future.running(): #* Not counted as a timeout if still waiting for a free worker
+					cls.timeouts[mountpoint] = cls.timeouts.get(mountpoint, 0) + 1
+					cls.retry[mountpoint] = now + min(interval * 2 ** cls.timeouts[mountpoint], cls.max_backoff)
+					errlog.debug(f'Disk usage of "{mountpoint}" timed out {cls.timeouts[mountpoint]} times in a row')
+
 class MemCollector(Collector):
 	'''Collects memory and disks information'''
 	values: Dict[str, int] = {}
-	vlist: Dict[str, List[int]] = {}
+	vlist: Dict[str, RingBuffer] = {}
 	percent: Dict[str, int] = {}
 	string: Dict[str, str] = {}
 
 	swap_values: Dict[str, int] = {}
-	swap_vlist: Dict[str, List[int]] = {}
+	swap_vlist: Dict[str, RingBuffer] = {}
 	swap_percent: Dict[str, int] = {}
 	swap_string: Dict[str, str] = {}
 
-	disks: Dict[str, Dict]
-	disk_hist: Dict[str, Tuple] = {}
-	timestamp: float = time()
+	disks: Dict[str, Dict] = {}
+	disk_rates: Rate = Rate()
+	disks_deadline: float = 0.0
 
 	io_error: bool = False
 
@@ -2920,9 +3938,9 @@ class MemCollector(Collector):
 			if key == "total": continue
 			cls.percent[key] = round(value * 100 / cls.values["total"])
 			if CONFIG.mem_graphs:
-				if not key in cls.vlist: cls.vlist[key] = []
+				if not key in cls.vlist: cls.vlist[key] = RingBuffer(MemBox.width, "B")
+				cls.vlist[key].resize(MemBox.width)
 				cls.vlist[key].append(cls.percent[key])
-				if len(cls.vlist[key]) > MemBox.width: del cls.vlist[key][0]
 
 		#* Collect swap
 		if CONFIG.show_swap or CONFIG.swap_disk:
@@ -2939,9 +3957,9 @@ class MemCollector(Collector):
 					if key == "total": continue
 					cls.swap_percent[key] = round(value * 100 / cls.swap_values["total"])
 					if CONFIG.mem_graphs:
-						if not key in cls.swap_vlist: cls.swap_vlist[key] = []
+						if not key in cls.swap_vlist: cls.swap_vlist[key] = RingBuffer(MemBox.width, "B")
+						cls.swap_vlist[key].resize(MemBox.width)
 						cls.swap_vlist[key].append(cls.swap_percent[key])
-						if len(cls.swap_vlist[key]) > MemBox.width: del cls.swap_vlist[key][0]
 			else:
 				if MemBox.swap_on:
 					MemBox.redraw = True
@@ -2951,8 +3969,12 @@ class MemCollector(Collector):
 				MemBox.redraw = True
 			MemBox.swap_on = False
 
+		report("mem", **cls.values)
 
 		if not CONFIG.show_disks: return
+		if not cls.redraw and not cls.due(cls.disks_deadline, time()): return
+		cls.disks_deadline = time() + cls.interval("disk_update_ms")
+		cls.disk_rates.tick()
 		#* Collect disks usage
 		disk_read: int = 0
 		disk_write: int = 0
@@ -2963,6 +3985,8 @@ class MemCollector(Collector):
 		io_string: str
 		u_percent: int
 		disk_list: List[str] = []
+		disk_shown: List[Tuple[Any, str]] = []
+		disk_io_stats: Dict[str, int] = {}
 		cls.disks = {}
 
 		if CONFIG.disks_filter:
@@ -2984,8 +4008,6 @@ class MemCollector(Collector):
 			io_counters = None
 
 		for disk in psutil.disk_partitions():
-			disk_io = None
-			io_string = ""
 			disk_name = disk.mountpoint.rsplit('/', 1)[-1] if not disk.mountpoint == "/" else "root"
 			while disk_name in disk_list: disk_name += "_"
 			disk_list += [disk_name]
@@ -2996,13 +4018,17 @@ class MemCollector(Collector):
 			#elif filtering and disk_name.endswith(filtering)
 			if SYSTEM == "MacOS" and disk.mountpoint == "/private/var/vm":
 				continue
-			try:
-				disk_u = psutil.disk_usage(disk.mountpoint)
-			except:
-				pass
+			disk_shown.append((disk, disk_name))
+
+		#* Usage is probed in worker threads, mounts that don't answer in time keep their last known values marked as stale
+		DiskUsage.probe([disk.mountpoint for disk, _ in disk_shown], cls.interval("disk_update_ms"))
 
-			u_percent = round(disk_u.percent)
-			cls.disks[disk.device] = { "name" : disk_name, "used_percent" : u_percent, "free_percent" : 100 - u_percent }
+		for disk, disk_name in disk_shown:
+			disk_io = None
+			io_string = ""
+			disk_u = DiskUsage.usage[disk.mountpoint]
+			u_percent = round(disk_u.percent) if disk_u else 0
+			cls.disks[disk.device] = { "name" : disk_name, "used_percent" : u_percent, "free_percent" : 100 - u_percent if disk_u else 0, "stale" : DiskUsage.stale.get(disk.mountpoint, True) }
 			for name in ["total", "used", "free"]:
 				cls.disks[disk.device][name] = floating_humanizer(getattr(disk_u, name, 0))
 
@@ -3021,15 +4047,15 @@ class MemCollector(Collector):
 						disk_io = io_counters
 					else:
 						raise Exception
-					disk_read = round((disk_io.read_bytes - cls.disk_hist[disk.device][0]) / (time() - cls.timestamp))
-					disk_write = round((disk_io.write_bytes - cls.disk_hist[disk.device][1]) / (time() - cls.timestamp))
+					disk_read = round(cls.disk_rates.per_second((disk.device, "read"), disk_io.read_bytes))
+					disk_write = round(cls.disk_rates.per_second((disk.device, "write"), disk_io.write_bytes))
 				except:
 					disk_read = disk_write = 0
 			else:
 				disk_read = disk_write = 0
 
 			if disk_io:
-				cls.disk_hist[disk.device] = (disk_io.read_bytes, disk_io.write_bytes)
+				disk_io_stats[f'{disk_name}.read'], disk_io_stats[f'{disk_name}.write'] = disk_read, disk_write
 				if MemBox.disks_width > 30:
 					if disk_read > 0:
 						io_string += f'▲{floating_humanizer(disk_read, short=True)} '
@@ -3041,7 +4067,7 @@ class MemCollector(Collector):
 			cls.disks[disk.device]["io"] = io_string
 
 		if CONFIG.swap_disk and MemBox.swap_on:
-			cls.disks["__swap"] = { "name" : "swap", "used_percent" : cls.swap_percent["used"], "free_percent" : cls.swap_percent["free"], "io" : "" }
+			cls.disks["__swap"] = { "name" : "swap", "used_percent" : cls.swap_percent["used"], "free_percent" : cls.swap_percent["free"], "io" : "", "stale" : False }
 			for name in ["total", "used", "free"]:
 				cls.disks["__swap"][name] = cls.swap_string[name]
 			if len(cls.disks) > 2:
@@ -3057,57 +4083,84 @@ class MemCollector(Collector):
 			MemBox.redraw = True
 			cls.old_disks = disk_list.copy()
 
-		for name, value in cls.string.items():
-			report(**cls.string)
+		if disk_io_stats: report("disk", **disk_io_stats)
 
-		cls.timestamp = time()
+	@classmethod
+	def interval(cls, key: str = "") -> float:
+		if key or not CONFIG.show_disks: return super().interval(key)
+		return min(super().interval(), super().interval("disk_update_ms"))
 
 	@classmethod
 	def _draw(cls):
 		MemBox._draw_fg()
 
 class NetCollector(Collector):
-	'''Collects network stats'''
+	'''Collects network stats for all up network devices from one counters call per update
+	* .nics : Up devices sorted by highest throughput, bond and bridge ports and VLANs listed after the device they belong to, and "all" last if more than one device is up
+	* "all" is the sum of all top level devices except loopback, ports and VLANs are left out to not count traffic twice
+	* Stats and speed history are kept for every device, switching with b/n shows the selected device history
+	'''
 	buffer: str = NetBox.buffer
+	interval_key: str = "net_update_ms"
 	nics: List[str] = []
 	nic_i: int = 0
 	nic: str = ""
 	new_nic: str = ""
 	nic_error: bool = False
+	up: Set[str] = set()
+	parents: Dict[str, str] = {}
+	top_nics: List[str] = []
 	reset: bool = False
 	graph_raise: Dict[str, int] = {"download" : 5, "upload" : 5}
 	graph_lower: Dict[str, int] = {"download" : 5, "upload" : 5}
 	#min_top: int = 10<<10
-	#* Stats structure = stats[netword device][download, upload][total, last, top, graph_top, offset, speed, redraw, graph_raise, graph_low] = int, List[int], bool
+	#* Stats structure = stats[netword device][download, upload][total, top, graph_top, offset, speed, redraw, graph_raise, graph_low] = int, RingBuffer, bool
 	stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
 	#* Strings structure strings[network device][download, upload][total, byte_ps, bit_ps, top, graph_top] = str
 	strings: Dict[str, Dict[str, Dict[str, str]]] = {}
 	switched: bool = False
-	timestamp: float = time()
+	rates: Rate = Rate()
 	net_min: Dict[str, int] = {"download" : -1, "upload" : -1}
 	auto_min: bool = CONFIG.net_auto
 	sync_top: int = 0
 	sync_string: str = ""
 
 	@classmethod
-	def _get_nics(cls):
-		'''Get a list of all network devices sorted by highest throughput'''
-		cls.nic_i = 0
-		cls.nic = ""
+	def _get_nics(cls, io_all: Dict[str, Any], up_stat: Dict[str, Any]) -> bool:
+		'''Update list of up network devices, returns True if changed'''
+		up: Set[str] = {nic for nic in io_all if nic in up_stat and up_stat[nic].isup}
+		if up == cls.up: return False
+		for nic in up - cls.up: cls.parents[nic] = cls._parent(nic)
+		cls.up = up
+		children: Dict[str, List[str]] = defaultdict(list)
+		for nic in sorted(up, key=lambda nic: io_all[nic].bytes_recv + io_all[nic].bytes_sent, reverse=True):
+			children[cls.parents[nic] if cls.parents[nic] in up else ""].append(nic)
+		cls.top_nics = [nic for nic in children[""] if nic not in ["lo", "lo0"]]
+		nics: List[str] = []
+		stack: List[str] = children[""][::-1]
+		while stack:
+			nics.append(stack.pop())
+			stack.extend(children[nics[-1]][::-1])
+		if len(nics) > 1: nics.append("all")
+		cls.nics = nics if nics else [""]
+		if cls.nic not in cls.nics: cls.nic = cls.nics[0]
+		cls.nic_i = cls.nics.index(cls.nic)
+		return True
+
+	@staticmethod
+	def _parent(nic: str) -> str:
+		'''Returns the bond or bridge a port belongs to or the device under a VLAN, empty string for top level devices and on systems without sysfs'''
+		path: str = f'/sys/class/net/{nic}'
 		try:
-			io_all = psutil.net_io_counters(pernic=True)
-		except Exception as e:
-			if not cls.nic_error:
-				cls.nic_error = True
-				errlog.exception(f'{e}')
-		if not io_all: return
-		up_stat = psutil.net_if_stats()
-		for nic in sorted(io_all.keys(), key=lambda nic: (getattr(io_all[nic], "bytes_recv", 0) + getattr(io_all[nic], "bytes_sent", 0)), reverse=True):
-			if nic not in up_stat or not up_stat[nic].isup:
-				continue
-			cls.nics.append(nic)
-		if not cls.nics: cls.nics = [""]
-		cls.nic = cls.nics[cls.nic_i]
+			if os.path.islink(f'{path}/master'):
+				return os.path.basename(os.readlink(f'{path}/master'))
+			with open(f'{path}/uevent', "r") as f:
+				if "DEVTYPE=vlan" in f.read():
+					for entry in os.listdir(path):
+						if entry.startswith("lower_"): return entry[6:]
+		except OSError:
+			pass
+		return ""
 
 	@classmethod
 	def switch(cls, key: str):
@@ -3121,91 +4174,102 @@ class NetCollector(Collector):
 
 	@classmethod
 	def _collect(cls):
-		speed: int
-		stat: Dict
-		up_stat = psutil.net_if_stats()
-
-		if cls.switched:
-			cls.nic = cls.new_nic
-			cls.switched = False
-
-		if not cls.nic or cls.nic not in up_stat or not up_stat[cls.nic].isup:
-			cls._get_nics()
-			if not cls.nic: return
+		speeds: Dict[str, int] = {}
+		totals: Dict[str, Tuple[int, int]]
 		try:
-			io_all = psutil.net_io_counters(pernic=True)[cls.nic]
-		except KeyError:
-			pass
+			io_all = psutil.net_io_counters(pernic=True)
+			up_stat = psutil.net_if_stats()
+		except Exception as e:
+			if not cls.nic_error:
+				cls.nic_error = True
+				errlog.exception(f'{e}')
 			return
-		if not cls.nic in cls.stats:
-			cls.stats[cls.nic] = {}
-			cls.strings[cls.nic] = { "download" : {}, "upload" : {}}
-			for direction, value in ["download", io_all.bytes_recv], ["upload", io_all.bytes_sent]:
-				cls.stats[cls.nic][direction] = { "total" : value, "last" : value, "top" : 0, "graph_top" : 0, "offset" : 0, "speed" : [], "redraw" : True, "graph_raise" : 0, "graph_lower" : 7 }
-				for v in ["total", "byte_ps", "bit_ps", "top", "graph_top"]:
-					cls.strings[cls.nic][direction][v] = ""
+		cls.rates.tick()
+		if cls._get_nics(io_all, up_stat): cls.rates.reset(("all", "download"), ("all", "upload")) #* Set of summed devices changed
 
-		cls.stats[cls.nic]["download"]["total"] = io_all.bytes_recv
-		cls.stats[cls.nic]["upload"]["total"] = io_all.bytes_sent
+		if cls.switched:
+			if cls.new_nic in cls.nics:
+				cls.nic = cls.new_nic
+				cls.nic_i = cls.nics.index(cls.nic)
+			cls.switched = False
+		if not cls.nic: return
+
+		totals = { nic : (io_all[nic].bytes_recv, io_all[nic].bytes_sent) for nic in cls.nics if nic in io_all }
+		if "all" in cls.nics:
+			totals["all"] = (sum(io_all[nic].bytes_recv for nic in cls.top_nics), sum(io_all[nic].bytes_sent for nic in cls.top_nics))
+		new_min: List[str] = [direction for direction in ["download", "upload"] if cls.net_min[direction] == -1]
+		for direction in new_min:
+			cls.net_min[direction] = units_to_bytes(getattr(CONFIG, "net_" + direction))
+
+		for nic, (recv, sent) in totals.items():
+			if not nic in cls.stats:
+				cls.stats[nic] = {}
+				cls.strings[nic] = { "download" : {}, "upload" : {}}
+				for direction, value in ["download", recv], ["upload", sent]:
+					cls.stats[nic][direction] = { "total" : value, "top" : 0, "graph_top" : max(cls.net_min[direction], 0), "offset" : 0, "speed" : RingBuffer(NetBox.width * 2, "q"), "redraw" : True, "graph_raise" : 0, "graph_lower" : 7 }
+					for v in ["total", "byte_ps", "bit_ps", "top", "graph_top"]:
+						cls.strings[nic][direction][v] = ""
+
+			cls.stats[nic]["download"]["total"] = recv
+			cls.stats[nic]["upload"]["total"] = sent
+
+			for direction in ["download", "upload"]:
+				stat = cls.stats[nic][direction]
+				#* Calculate current speed
+				speed: int = round(cls.rates.per_second((nic, direction), stat["total"]))
+				stat["speed"].resize(NetBox.width * 2)
+				stat["speed"].append(speed)
+				speeds[f'{nic}.{direction}'] = speed
+
+				if direction in new_min:
+					stat["graph_top"] = cls.net_min[direction]
+					stat["graph_lower"] = 7
+					if not cls.auto_min: stat["redraw"] = True
+
+				if stat["offset"] and stat["offset"] > stat["total"]:
+					if nic == cls.nic: cls.reset = True
+					else: stat["offset"] = 0
+
+				if cls.reset and nic == cls.nic:
+					if not stat["offset"]:
+						stat["offset"] = stat["total"]
+					else:
+						stat["offset"] = 0
+					if direction == "upload":
+						cls.reset = False
+						NetBox.redraw = True
 
+				if speed > stat["top"] or not stat["top"]:
+					stat["top"] = speed
+
+				if cls.auto_min:
+					if speed > stat["graph_top"]:
+						stat["graph_raise"] += 1
+						if stat["graph_lower"] > 0: stat["graph_lower"] -= 1
+					elif speed < stat["graph_top"] // 10:
+						stat["graph_lower"] += 1
+						if stat["graph_raise"] > 0: stat["graph_raise"] -= 1
+
+					if stat["graph_raise"] >= 5 or stat["graph_lower"] >= 5:
+						if stat["graph_raise"] >= 5:
+							stat["graph_top"] = round(max(stat["speed"][-5:]) / 0.8)
+						elif stat["graph_lower"] >= 5:
+							stat["graph_top"] = max(10 << 10, max(stat["speed"][-5:]) * 3)
+						stat["graph_raise"] = 0
+						stat["graph_lower"] = 0
+						stat["redraw"] = True
+
+		#* Strings are only needed for the shown device
 		for direction in ["download", "upload"]:
 			stat = cls.stats[cls.nic][direction]
 			strings = cls.strings[cls.nic][direction]
-			#* Calculate current speed
-			stat["speed"].append(round((stat["total"] - stat["last"]) / (time() - cls.timestamp)))
-			stat["last"] = stat["total"]
-			speed = stat["speed"][-1]
-
-			if cls.net_min[direction] == -1:
-				cls.net_min[direction] = units_to_bytes(getattr(CONFIG, "net_" + direction))
-				stat["graph_top"] = cls.net_min[direction]
-				stat["graph_lower"] = 7
-				if not cls.auto_min:
-					stat["redraw"] = True
-					strings["graph_top"] = floating_humanizer(stat["graph_top"], short=True)
-
-			if stat["offset"] and stat["offset"] > stat["total"]:
-				cls.reset = True
-
-			if cls.reset:
-				if not stat["offset"]:
-					stat["offset"] = stat["total"]
-				else:
-					stat["offset"] = 0
-				if direction == "upload":
-					cls.reset = False
-					NetBox.redraw = True
-
-			if len(stat["speed"]) > NetBox.width * 2:
-				del stat["speed"][0]
-
 			strings["total"] = floating_humanizer(stat["total"] - stat["offset"])
 			strings["byte_ps"] = floating_humanizer(stat["speed"][-1], per_second=True)
 			strings["bit_ps"] = floating_humanizer(stat["speed"][-1], bit=True, per_second=True)
+			strings["top"] = floating_humanizer(stat["top"], bit=True, per_second=True)
+			strings["graph_top"] = floating_humanizer(stat["graph_top"], short=True)
 
-			if speed > stat["top"] or not stat["top"]:
-				stat["top"] = speed
-				strings["top"] = floating_humanizer(stat["top"], bit=True, per_second=True)
-
-			if cls.auto_min:
-				if speed > stat["graph_top"]:
-					stat["graph_raise"] += 1
-					if stat["graph_lower"] > 0: stat["graph_lower"] -= 1
-				elif speed < stat["graph_top"] // 10:
-					stat["graph_lower"] += 1
-					if stat["graph_raise"] > 0: stat["graph_raise"] -= 1
-
-				if stat["graph_raise"] >= 5 or stat["graph_lower"] >= 5:
-					if stat["graph_raise"] >= 5:
-						stat["graph_top"] = round(max(stat["speed"][-5:]) / 0.8)
-					elif stat["graph_lower"] >= 5:
-						stat["graph_top"] = max(10 << 10, max(stat["speed"][-5:]) * 3)
-					stat["graph_raise"] = 0
-					stat["graph_lower"] = 0
-					stat["redraw"] = True
-					strings["graph_top"] = floating_humanizer(stat["graph_top"], short=True)
-
-		cls.timestamp = time()
+		report("net", **speeds)
 
 		if CONFIG.net_sync:
 			c_max: int = max(cls.stats[cls.nic]["download"]["graph_top"], cls.stats[cls.nic]["upload"]["graph_top"])
@@ -3219,9 +4283,131 @@ class NetCollector(Collector):
 		NetBox._draw_fg()
 
 
+class ProcMem(NamedTuple):
+	rss: int
+	vms: int
+
+class ProcInfo:
+	'''Process found by ProcScanner, mimics the parts of psutil.Process used by ProcCollector'''
+	__slots__ = ("pid", "info", "_ppid")
+
+	def __init__(self, pid: int, ppid: int, info: Dict[str, Any]):
+		self.pid = pid
+		self._ppid = ppid
+		self.info = info
+
+	def ppid(self) -> int:
+		return self._ppid
+
+class ProcScanner:
+	'''Linux only fast path for ProcCollector, reads /proc/[pid]/stat, statm and cmdline directly into a reused buffer
+	* .process_iter(ad_value) : Returns a list of ProcInfo with the same info keys as psutil.process_iter() with ProcCollector.p_values and memory_info
+	* .available : False if not on Linux or after a failed scan, ProcCollector then falls back to psutil
+	* Command lines are cached per process and read again every .cmdline_refresh seconds, and on every scan for the process in the detailed view
+	'''
+	available: bool = SYSTEM == "Linux" and os.path.isfile("/proc/self/stat")
+	buf: bytearray = bytearray(4096)
+	clk_tck: int = os.sysconf("SC_CLK_TCK") if available else 100
+	page_size: int = os.sysconf("SC_PAGE_SIZE") if available else 4096
+	boot_time: float = 0.0
+	mem_total: int = 0
+	users: Dict[int, str] = {}
+	cpu_rates: Rate = Rate()
+	static: Dict[int, Tuple[int, str, Any, str, float]] = {}
+	cmdline_refresh: float = 10.0
+
+	@classmethod
+	def _read(cls, path: str) -> bytes:
+		fd: int = os.open(path, os.O_RDONLY)
+		try:
+			size: int = os.readv(fd, [cls.buf])
+			while size == len(cls.buf): #* Grow the shared buffer for long command lines and keep it for the next read
+				cls.buf.extend(bytes(len(cls.buf)))
+				with memoryview(cls.buf) as view:
+					size += os.readv(fd, [view[size:]])
+		finally:
+			os.close(fd)
+		return bytes(cls.buf[:size])
+
+	@classmethod
+	def _username(cls, pid: int) -> str:
+		'''Name of the real uid like psutil, the owner of /proc/[pid] is the effective uid and root for non-dumpable processes'''
+		status: bytes = cls._read(f'/proc/{pid}/status')
+		start: int = status.index(b'\nUid:') + 5
+		uid: int = int(status[start:status.index(b'\n', start)].split()[0])
+		if uid not in cls.users:
+			try:
+				cls.users[uid] = pwd.getpwuid(uid).pw_name
+			except KeyError:
+				cls.users[uid] = str(uid)
+		return cls.users[uid]
+
+	@staticmethod
+	def _cmdline(data: bytes) -> List[str]:
+		if not data: return []
+		if data.endswith(b'\0'): data = data[:-1]
+		cmdline: List[str] = data.decode(errors="replace").split("\0")
+		if len(cmdline) == 1 and " " in cmdline[0]: cmdline = cmdline[0].split(" ") #* Some processes rewrite their arguments without null separators
+		return cmdline
+
+	@classmethod
+	def process_iter(cls, ad_value: Any = None) -> List[ProcInfo]:
+		out: List[ProcInfo] = []
+		static: Dict[int, Tuple[int, str, Any, str, float]] = {}
+		now: float = monotonic()
+		refresh: float = now - cls.cmdline_refresh
+		if not cls.boot_time: cls.boot_time = psutil.boot_time()
+		if not cls.mem_total: cls.mem_total = psutil.virtual_memory().total
+		cls.cpu_rates.tick()
+		for entry in os.listdir("/proc"):
+			if not entry.isdigit(): continue
+			pid: int = int(entry)
+			try:
+				stat: bytes = cls._read(f'/proc/{pid}/stat')
+				name: str = stat[stat.index(b'(') + 1:stat.rindex(b')')].decode(errors="replace")
+				fields: List[bytes] = stat[stat.rindex(b')') + 2:].split() #* fields[n] is field n + 3 in proc(5)
+				statm: List[bytes] = cls._read(f'/proc/{pid}/statm').split()
+				start: int = int(fields[19])
+				if pid in cls.static and cls.static[pid][:2] == (start, name):
+					#* Same process as last scan and no exec since, owner doesn't need to be read again
+					_, _, cmdline, username, read = cls.static[pid]
+				else:
+					cmdline, username, read = None, cls._username(pid), 0.0
+				if read < refresh or pid == ProcCollector.detailed_pid: #* Processes can rewrite their cmdline at any time, see setproctitle(3)
+					try:
+						cmdline = cls._cmdline(cls._read(f'/proc/{pid}/cmdline'))
+					except PermissionError:
+						cmdline = ad_value
+					read = now
+			except (FileNotFoundError, ProcessLookupError):
+				continue
+			static[pid] = (start, name, cmdline, username, read)
+			ticks: int = int(fields[11]) + int(fields[12])
+			cpu_percent: float = round(cls.cpu_rates.per_second((pid, start), ticks) / cls.clk_tck * 100, 1) #* Start time in key to not mix up reused pids
+			if len(name) >= 15 and cmdline and cmdline != ad_value:
+				#* The kernel truncates names to 15 characters, use the executable from cmdline like psutil does
+				exe: str = os.path.basename(cmdline[0])
+				if exe.startswith(name): name = exe
+			rss: int = int(statm[1]) * cls.page_size
+			out.append(ProcInfo(pid, int(fields[1]), {
+				"pid" : pid,
+				"name" : name,
+				"cmdline" : cmdline,
+				"num_threads" : int(fields[17]),
+				"username" : username,
+				"memory_percent" : rss * 100 / cls.mem_total,
+				"memory_info" : ProcMem(rss, int(statm[0]) * cls.page_size),
+				"cpu_percent" : cpu_percent,
+				"cpu_times" : (int(fields[11]) / cls.clk_tck, int(fields[12]) / cls.clk_tck),
+				"create_time" : cls.boot_time + start / cls.clk_tck }))
+		cls.static = static
+		return out
+
+
 class ProcCollector(Collector):
 	'''Collects process stats'''
 	buffer: str = ProcBox.buffer
+	interval_key: str = "proc_update_ms"
 	search_filter: str = ""
 	processes: Dict = {}
 	num_procs: int = 0
@@ -3229,87 +4415,179 @@ class ProcCollector(Collector):
 	detailed: bool = False
 	detailed_pid: Union[int, None] = None
 	details: Dict[str, Any] = {}
-	details_cpu: List[int] = []
-	details_mem: List[int] = []
+	details_cpu: RingBuffer = RingBuffer(0, "I")
+	details_mem: RingBuffer = RingBuffer(0, "I")
+	cache: Dict[int, Dict[str, Any]] = {}
 	expand: int = 0
 	collapsed: Dict = {}
+	tree_parent: Dict[int, int] = {}
+	tree_children: Dict[int, Set[int]] = {}
+	tree_values: Dict[int, Tuple[int, float, int, float, int]] = {}
+	tree_totals: Dict[int, List[Union[int, float]]] = {}
+	tree_branch: Dict[bool, str] = { False : " ├─ ", True : " └─ " }
+	tree_cont: Dict[bool, str] = { False : " │ ", True : "  " }
+	tree_fold: Dict[bool, str] = { False : "[-]─", True : "[+]─" }
 	tree_counter: int = 0
+	scan: List = []
+	scan_key: Callable[[Any], Tuple] = lambda p: ()
+	extend: bool = False
+	report_top: int = 5
 	p_values: List[str] = ["pid", "name", "cmdline", "num_threads", "username", "memory_percent", "cpu_percent", "cpu_times", "create_time"]
-	sort_expr: Dict = {}
-	sort_expr["pid"] = compile("p.info['pid']", "str", "eval")
-	sort_expr["program"] = compile("'' if p.info['name'] == 0.0 else p.info['name']", "str", "eval")
-	sort_expr["arguments"] = compile("' '.join(str(p.info['cmdline'])) or ('' if p.info['name'] == 0.0 else p.info['name'])", "str", "eval")
-	sort_expr["threads"] = compile("0 if p.info['num_threads'] == 0.0 else p.info['num_threads']", "str", "eval")
-	sort_expr["user"] = compile("'' if p.info['username'] == 0.0 else p.info['username']", "str", "eval")
-	sort_expr["memory"] = compile("p.info['memory_percent']", "str", "eval")
-	sort_expr["cpu lazy"] = compile("(sum(p.info['cpu_times'][:2] if not p.info['cpu_times'] == 0.0 else [0.0, 0.0]) * 1000 / (time() - p.info['create_time']))", "str", "eval")
-	sort_expr["cpu responsive"] = compile("(p.info['cpu_percent'] if CONFIG.proc_per_core else (p.info['cpu_percent'] / THREADS))", "str", "eval")
+	#* Key functions taking (info, now), values equal to the ad_value 0.0 are replaced so different types never gets compared
+	sort_keys: Dict[str, Callable[[Dict[str, Any], float], Any]] = {
+		"pid" : lambda info, now: info["pid"],
+		"program" : lambda info, now: "" if info["name"] == 0.0 else info["name"],
+		"arguments" : lambda info, now: " ".join(info["cmdline"]) if info["cmdline"] and info["cmdline"] != 0.0 else ("" if info["name"] == 0.0 else info["name"]),
+		"threads" : lambda info, now: 0 if info["num_threads"] == 0.0 else info["num_threads"],
+		"user" : lambda info, now: "" if info["username"] == 0.0 else info["username"],
+		"memory" : lambda info, now: info["memory_percent"],
+		"cpu lazy" : lambda info, now: 0.0 if info["cpu_times"] == 0.0 else sum(info["cpu_times"][:2]) * 1000 / (now - info["create_time"]),
+		"cpu responsive" : lambda info, now: info["cpu_percent"],
+		}
+
+	@classmethod
+	def sort_key(cls, *sortings: str, reverse: bool = False) -> Callable[[Any], Tuple]:
+		'''Returns a key function sorting processes on one or more of sort_keys, with pid as last key for a stable order of equal values
+		* Time based keys share one timestamp taken when the key function is created
+		* Set reverse when sorting in reverse, the pid is then negated so equal values still come out by ascending pid
+		'''
+		now: float = time()
+		sign: int = -1 if reverse else 1
+		keys: List[Callable[[Dict[str, Any], float], Any]] = [cls.sort_keys[sorting] for sorting in sortings]
+		if len(keys) == 1:
+			key = keys[0]
+			return lambda p: (key(p.info, now), sign * p.info["pid"])
+		return lambda p: (*(key(p.info, now) for key in keys), sign * p.info["pid"])
+
+	@classmethod
+	def sort(cls, processes: Iterable, key: Callable[[Any], Tuple], reverse: bool = False, limit: int = 0) -> List:
+		'''Returns processes sorted by key, if limit is set only the first limit processes are sorted and returned'''
+		if limit:
+			return nlargest(limit, processes, key=key) if reverse else nsmallest(limit, processes, key=key)
+		return sorted(processes, key=key, reverse=reverse)
+
+	@classmethod
+	def _process_iter(cls, ad_value: Any) -> Iterable:
+		'''Process list from ProcScanner on Linux, psutil.process_iter() elsewhere or if the scanner fails'''
+		if ProcScanner.available:
+			try:
+				return ProcScanner.process_iter(ad_value)
+			except Exception as e:
+				errlog.warning(f'Reading /proc directly failed, falling back to psutil for process info')
+				errlog.exception(f'{e}')
+				ProcScanner.available = False
+		return psutil.process_iter(cls.p_values + (["memory_info"] if CONFIG.proc_mem_bytes else []), ad_value)
+
+	@classmethod
+	def _listed(cls, err: Any, seen: List[int]) -> Iterator:
+		'''Yields all processes that should be listed and adds their pids to seen'''
+		for p in cls._process_iter(err):
+			if p.info["name"] == "idle" or p.info["name"] == err or p.info["pid"] == err:
+				continue
+			seen.append(p.info["pid"])
+			if cls.detailed and p.info["pid"] == cls.detailed_pid:
+				cls.det_cpu = p.info["cpu_percent"]
+			yield p
+
+	@classmethod
+	def _cached(cls, info: Dict[str, Any], err: Any) -> Dict[str, Any]:
+		'''Returns the persistent entry for process in info, static strings are only built when a pid is new, reused, has exec'd or changed its cmdline'''
+		entry: Union[Dict[str, Any], None] = cls.cache.get(info["pid"])
+		if entry is None or entry["create_time"] != info["create_time"] or entry["name"] != info["name"] or entry["cmdline"] != info["cmdline"]:
+			args: str = "" if info["cmdline"] == err else " ".join(info["cmdline"])
+			entry = cls.cache[info["pid"]] = {
+				"name" : info["name"],
+				"cmdline" : info["cmdline"],
+				"cmd" : args or "[" + info["name"] + "]",
+				"args" : args,
+				"username" : "" if info["username"] == err else info["username"],
+				"create_time" : info["create_time"] }
+		return entry
+
+	@classmethod
+	def _evict(cls, pids: Iterable[int]):
+		'''Remove cached entries for all processes not in pids'''
+		for pid in cls.cache.keys() - set(pids):
+			del cls.cache[pid]
+
+	@classmethod
+	def _rows(cls, processes: List, sort_key: Callable[[Any], Tuple], reverse: bool, limit: int, search: str, err: Any) -> Optional[Dict]:
+		'''Returns the rows for processes sorted by sort_key and filtered by search, or None if interrupted'''
+		out: Dict = {}
+		proc_per_cpu: bool = CONFIG.proc_per_core
+		for p in cls.sort(processes, sort_key, reverse=reverse, limit=limit):
+			if cls.collect_interrupt or cls.proc_interrupt:
+				return None
+			entry = cls._cached(p.info, err)
+			if search:
+				for value in [ entry["name"], entry["args"], str(p.info["pid"]), entry["username"] ]:
+					for s in search.split(","):
+						if s.strip() in value:
+							break
+					else: continue
+					break
+				else: continue
+
+			entry["threads"] = 0 if p.info["num_threads"] == err else p.info["num_threads"]
+			entry["mem"] = p.info["memory_percent"]
+			entry["mem_b"] = p.info["memory_info"].rss if CONFIG.proc_mem_bytes and hasattr(p.info["memory_info"], "rss") else 0
+			entry["cpu"] = p.info["cpu_percent"] if proc_per_cpu else round(p.info["cpu_percent"] / THREADS, 2)
+			out[p.info["pid"]] = entry
+		return out
+
+	@classmethod
+	def _report(cls, processes: List):
+		'''Export the number of processes and threads, and pid and cpu percent of the .report_top processes using the most cpu'''
+		top: List = nlargest(cls.report_top, processes, key=lambda p: p.info["cpu_percent"])
+		report("proc", processes=len(processes), threads=sum(p.info["num_threads"] or 0 for p in processes),
+			top_pid=[p.info["pid"] for p in top], top_cpu=[float(p.info["cpu_percent"]) for p in top])
 
 	@classmethod
 	def _collect(cls):
 		'''List all processess with pid, name, arguments, threads, username, memory percent and cpu percent'''
 		if Box.stat_mode: return
-		out: Dict = {}
-		cls.det_cpu = 0.0
+		if HEADLESS:
+			#* Nothing is drawn, skip sorting and building rows and only export the stats row
+			cls._report(list(cls._listed(0.0, [])))
+			return
+		extend, cls.extend = cls.extend, False
 		sorting: str = CONFIG.proc_sorting
 		reverse: bool = not CONFIG.proc_reversed
 		proc_per_cpu: bool = CONFIG.proc_per_core
 		search: str = cls.search_filter
 		err: float = 0.0
-		n: int = 0
+		seen: List[int] = []
+		out: Optional[Dict]
 
 		if CONFIG.proc_tree and sorting == "arguments":
 			sorting = "program"
 
-		sort_cmd = cls.sort_expr[sorting]
+		#* Without a search only the rows up to one page below the visible ones are sorted and built
+		limit: int = ProcBox.start - 1 + ProcBox.select_max * 2 if ProcBox.select_max and not search else 0
 
-		if CONFIG.proc_tree:
-			cls._tree(sort_cmd=sort_cmd, reverse=reverse, proc_per_cpu=proc_per_cpu, search=search)
-		else:
-			for p in sorted(psutil.process_iter(cls.p_values + (["memory_info"] if CONFIG.proc_mem_bytes else []), err), key=lambda p: eval(sort_cmd), reverse=reverse):
-				if cls.collect_interrupt or cls.proc_interrupt:
-					return
-				if p.info["name"] == "idle" or p.info["name"] == err or p.info["pid"] == err:
-					continue
-				if p.info["cmdline"] == err:
-					p.info["cmdline"] = ""
-				if p.info["username"] == err:
-					p.info["username"] = ""
-				if p.info["num_threads"] == err:
-					p.info["num_threads"] = 0
-				if search:
-					if cls.detailed and p.info["pid"] == cls.detailed_pid:
-						cls.det_cpu = p.info["cpu_percent"]
-					for value in [ p.info["name"], " ".join(p.info["cmdline"]), str(p.info["pid"]), p.info["username"] ]:
-						for s in search.split(","):
-							if s.strip() in value:
-								break
-						else: continue
-						break
-					else: continue
-
-				cpu = p.info["cpu_percent"] if proc_per_cpu else round(p.info["cpu_percent"] / THREADS, 2)
-				mem = p.info["memory_percent"]
-				if CONFIG.proc_mem_bytes and hasattr(p.info["memory_info"], "rss"):
-					mem_b = p.info["memory_info"].rss
-				else:
-					mem_b = 0
+		if extend and cls.scan and not CONFIG.proc_tree:
+			#* Scrolled past the built rows, build more from the last scan without sampling the processes again
+			out = cls._rows(cls.scan, cls.scan_key, reverse, limit, search, err)
+			if out is not None: cls.processes = out
+			return
 
-				cmd = " ".join(p.info["cmdline"]) or "[" + p.info["name"] + "]"
+		cls.det_cpu = 0.0
+		sort_key = cls.sort_key(sorting, reverse=reverse)
 
-				out[p.info["pid"]] = {
-					"name" : p.info["name"],
-					"cmd" : cmd,
-					"threads" : p.info["num_threads"],
-					"username" : p.info["username"],
-					"mem" : mem,
-					"mem_b" : mem_b,
-					"cpu" : cpu }
+		if CONFIG.proc_tree:
+			cls.scan = []
+			cls._tree(sort_key=sort_key, reverse=reverse, proc_per_cpu=proc_per_cpu, search=search)
+		else:
+			cls.scan = list(cls._listed(err, seen))
+			cls.scan_key = sort_key
+			out = cls._rows(cls.scan, sort_key, reverse, limit, search, err)
+			if out is None: return
 
-				n += 1
+			cls._evict(seen)
+			cls.num_procs = len(seen) if limit else len(out)
+			cls.processes = out
 
-			cls.num_procs = n
-			cls.processes = out.copy()
+		cls._report(cls.scan)
 
 		if cls.detailed:
 			cls.expand = ((ProcBox.width - 2) - ((ProcBox.width - 2) // 3) - 40) // 10
@@ -3381,6 +4659,8 @@ class ProcCollector(Collector):
 							else: cls.details["io_write"] = "?"
 					if cls.expand > 4 : cls.details["terminal"] = f'{cls.details["terminal"]}'.replace("/dev/", "")
 
+				cls.details_cpu.resize(ProcBox.width)
+				cls.details_mem.resize(ProcBox.width)
 				cls.details_cpu.append(cls.details["cpu_percent"])
 				mem = cls.details["memory_percent"]
 				if mem > 80: mem = round(mem)
@@ -3390,46 +4670,114 @@ class ProcCollector(Collector):
 				elif mem > 5: mem = round(mem * 10)
 				else: mem = round(mem * 20)
 				cls.details_mem.append(mem)
-				if len(cls.details_cpu) > ProcBox.width: del cls.details_cpu[0]
-				if len(cls.details_mem) > ProcBox.width: del cls.details_mem[0]
 
 	@classmethod
-	def _tree(cls, sort_cmd, reverse: bool, proc_per_cpu: bool, search: str):
+	def _tree_add(cls, pid: int, values: Iterable[Union[int, float]], sign: int = 1):
+		'''Add values times sign to the subtree totals of pid and all its linked ancestors'''
+		values = [v * sign for v in values]
+		while True:
+			totals: List[Union[int, float]] = cls.tree_totals.setdefault(pid, [0, 0.0, 0, 0.0, 0])
+			for i, value in enumerate(values):
+				totals[i] += value
+			ppid: Union[int, None] = cls.tree_parent.get(pid)
+			if ppid is None or ppid == pid: break
+			pid = ppid
+
+	@classmethod
+	def _tree_link(cls, pid: int, ppid: int):
+		cls.tree_parent[pid] = ppid
+		if ppid != pid: cls.tree_children.setdefault(ppid, set()).add(pid)
+		if ppid != pid and pid in cls.tree_totals: cls._tree_add(ppid, cls.tree_totals[pid])
+
+	@classmethod
+	def _tree_unlink(cls, pid: int):
+		ppid: int = cls.tree_parent.pop(pid)
+		if ppid in cls.tree_children: cls.tree_children[ppid].discard(pid)
+		if ppid != pid and pid in cls.tree_totals: cls._tree_add(ppid, cls.tree_totals[pid], -1)
+
+	@classmethod
+	def _tree_index(cls, parents: Dict[int, int], values: Dict[int, Tuple[int, float, int, float, int]]):
+		'''Update the persistent parent and children maps with births, deaths and reparented processes from parents,
+		and the subtree totals of (threads, mem, mem_b, cpu, processes) by propagating only what changed up to the ancestors'''
+		moved: List[int] = [pid for pid, ppid in parents.items() if pid in cls.tree_parent and cls.tree_parent[pid] != ppid]
+		dead: List[int] = list(cls.tree_parent.keys() - parents.keys())
+		#* Subtrees are detached with their totals before any new links are made, linking the same way can then never count a process twice
+		for pid in moved + dead:
+			cls._tree_unlink(pid)
+		for pid in dead:
+			own: Optional[Tuple[int, float, int, float, int]] = cls.tree_values.pop(pid, None)
+			if cls.tree_children.get(pid):
+				#* Children still pointing at a dead parent keeps it as an empty placeholder, like the missing parent of pid 1
+				if own: cls._tree_add(pid, own, -1)
+			else:
+				cls.tree_totals.pop(pid, None)
+		for pid in moved:
+			cls._tree_link(pid, parents[pid])
+		for pid, ppid in parents.items():
+			if pid not in cls.tree_parent:
+				cls._tree_link(pid, ppid)
+			old: Tuple[int, float, int, float, int] = cls.tree_values.get(pid, (0, 0.0, 0, 0.0, 0))
+			if old != values[pid]:
+				cls._tree_add(pid, [new - last for new, last in zip(values[pid], old)])
+				cls.tree_values[pid] = values[pid]
+		for ppid in [ppid for ppid, children in cls.tree_children.items() if not children]:
+			del cls.tree_children[ppid]
+			if ppid not in cls.tree_parent: cls.tree_totals.pop(ppid, None)
+		if cls.tree_counter >= 100:
+			#* Full recount now and then, so float rounding from the deltas can't build up
+			cls.tree_totals = {}
+			for pid, own in cls.tree_values.items():
+				cls._tree_add(pid, own)
+
+	@classmethod
+	def _tree(cls, sort_key: Callable[[Any], Tuple], reverse: bool, proc_per_cpu: bool, search: str):
 		'''List all processess in a tree view with pid, name, threads, username, memory percent and cpu percent'''
 		out: Dict = {}
 		err: float = 0.0
 		det_cpu: float = 0.0
 		infolist: Dict = {}
+		parents: Dict[int, int] = {}
+		rank: Dict[int, int] = {}
+		values: Dict[int, Tuple[int, float, int, float, int]] = {}
 		cls.tree_counter += 1
-		tree = defaultdict(list)
-		n: int = 0
-		for p in sorted(psutil.process_iter(cls.p_values + (["memory_info"] if CONFIG.proc_mem_bytes else []), err), key=lambda p: eval(sort_cmd), reverse=reverse):
+		cls.scan = cls.sort(cls._process_iter(err), sort_key, reverse=reverse)
+		for p in cls.scan:
 			if cls.collect_interrupt: return
 			try:
-				tree[p.ppid()].append(p.pid)
+				parents[p.pid] = p.ppid()
 			except (psutil.NoSuchProcess, psutil.ZombieProcess):
 				pass
 			else:
 				infolist[p.pid] = p.info
-				n += 1
-		if 0 in tree and 0 in tree[0]:
-			tree[0].remove(0)
-
-		def create_tree(pid: int, tree: defaultdict, indent: str = "", inindent: str = " ", found: bool = False, depth: int = 0, collapse_to: Union[None, int] = None):
-			nonlocal infolist, proc_per_cpu, search, out, det_cpu
+				rank[p.pid] = len(rank)
+				if p.info["name"] == err:
+					values[p.pid] = (0, 0.0, 0, 0.0, 0)
+				else:
+					values[p.pid] = (
+						0 if p.info["num_threads"] == err else p.info["num_threads"],
+						p.info["memory_percent"],
+						p.info["memory_info"].rss if CONFIG.proc_mem_bytes and hasattr(p.info["memory_info"], "rss") else 0,
+						p.info["cpu_percent"] if proc_per_cpu else round(p.info["cpu_percent"] / THREADS, 2),
+						1)
+		cls._tree_index(parents, values)
+		if not cls.tree_children: return
+
+		#* Depth first walk with an explicit stack of (pid, indent, last, found, depth), last is None for the root
+		#* Collapsed processes shows the subtree totals from the tree index, so their descendants are never visited
+		stack: List[Tuple[int, str, Union[bool, None], bool, int]] = [(min(cls.tree_children), "", None, False, 0)]
+		while stack:
+			if cls.collect_interrupt: return
+			pid, indent, last, found, depth = stack.pop()
 			name: str; threads: int; username: str; mem: float; cpu: float; collapse: bool = False
 			cont: bool = True
-			getinfo: Dict = {}
-			if cls.collect_interrupt: return
-			try:
-				name = psutil.Process(pid).name()
-				if name == "idle": return
-			except psutil.Error:
-				pass
+			getinfo: Dict = infolist.get(pid, {})
+			totals: List[Union[int, float]] = cls.tree_totals.get(pid, [0, 0.0, 0, 0.0, 0])
+			if getinfo and getinfo["name"] != err:
+				name = getinfo["name"]
+				if name == "idle": continue
+			else:
 				cont = False
 				name = ""
-			if pid in infolist:
-				getinfo = infolist[pid]
 
 			if search and not found:
 				if cls.detailed and pid == cls.detailed_pid:
@@ -3445,72 +4793,45 @@ class ProcCollector(Collector):
 					break
 				else: cont = False
 			if cont:
-				if getinfo:
-					if getinfo["num_threads"] == err: threads = 0
-					else: threads = getinfo["num_threads"]
-					if getinfo["username"] == err: username = ""
-					else: username = getinfo["username"]
-					cpu = getinfo["cpu_percent"] if proc_per_cpu else round(getinfo["cpu_percent"] / THREADS, 2)
-					mem = getinfo["memory_percent"]
-					if getinfo["cmdline"] == err: cmd = ""
-					else: cmd = " ".join(getinfo["cmdline"]) or "[" + getinfo["name"] + "]"
-					if CONFIG.proc_mem_bytes and hasattr(getinfo["memory_info"], "rss"):
-						mem_b = getinfo["memory_info"].rss
-					else:
-						mem_b = 0
-				else:
-					threads = mem_b = 0
-					username = ""
-					mem = cpu = 0.0
+				entry = cls._cached(getinfo, err)
+				username = entry["username"]
+				cmd = "" if getinfo["cmdline"] == err else entry["cmd"]
 
 				if pid in cls.collapsed:
 					collapse = cls.collapsed[pid]
 				else:
 					collapse = True if depth > CONFIG.tree_depth else False
 					cls.collapsed[pid] = collapse
+				indent_out: str = " " if last is None else indent + (cls.tree_fold[collapse] if pid in cls.tree_children else cls.tree_branch[last])
+				if search: collapse = False
 
-				if collapse_to and not search:
-					out[collapse_to]["threads"] += threads
-					out[collapse_to]["mem"] += mem
-					out[collapse_to]["mem_b"] += mem_b
-					out[collapse_to]["cpu"] += cpu
-				else:
-					if pid in tree and len(tree[pid]) > 0:
-						sign: str = "+" if collapse else "-"
-						inindent = inindent.replace(" ├─ ", "[" + sign + "]─").replace(" └─ ", "[" + sign + "]─")
-					out[pid] = {
-						"indent" : inindent,
-						"name": name,
-						"cmd" : cmd,
-						"threads" : threads,
-						"username" : username,
-						"mem" : mem,
-						"mem_b" : mem_b,
-						"cpu" : cpu,
-						"depth" : depth,
-						}
-
-			if search: collapse = False
-			elif collapse and not collapse_to:
-				collapse_to = pid
-
-			if pid not in tree:
-				return
-			children = tree[pid][:-1]
+				threads, mem, mem_b, cpu = (totals if collapse else values[pid])[:4]
+				out[pid] = {
+					"indent" : indent_out,
+					"name": name,
+					"cmd" : cmd,
+					"threads" : threads,
+					"username" : username,
+					"mem" : mem,
+					"mem_b" : mem_b,
+					"cpu" : cpu,
+					"depth" : depth,
+					}
 
-			for child in children:
-				create_tree(child, tree, indent + " │ ", indent + " ├─ ", found=found, depth=depth+1, collapse_to=collapse_to)
-			create_tree(tree[pid][-1], tree, indent + "  ", indent + " └─ ", depth=depth+1, collapse_to=collapse_to)
+			if collapse or pid not in cls.tree_children: continue
+			if last is not None: indent += cls.tree_cont[last]
+			for n, child in enumerate(reversed(sorted(cls.tree_children[pid], key=lambda child: rank.get(child, len(rank))))):
+				stack.append((child, indent, n == 0, found, depth + 1))
 
-		create_tree(min(tree), tree)
 		cls.det_cpu = det_cpu
 
 		if cls.collect_interrupt: return
 		if cls.tree_counter >= 100:
 			cls.tree_counter = 0
 			for pid in list(cls.collapsed):
-				if not psutil.pid_exists(pid):
+				if not pid in cls.tree_parent:
 					del cls.collapsed[pid]
+		cls._evict(infolist)
 		cls.num_procs = len(out)
 		cls.processes = out.copy()
 
@@ -3520,7 +4841,7 @@ class ProcCollector(Collector):
 		if index >= len(CONFIG.sorting_options): index = 0
 		elif index < 0: index = len(CONFIG.sorting_options) - 1
 		CONFIG.proc_sorting = CONFIG.sorting_options[index]
-		if "left" in Key.mouse: del Key.mouse["left"]
+		Key.mouse_del("left")
 		Collector.collect(ProcCollector, interrupt=True, redraw=True)
 
 	@classmethod
@@ -3670,6 +4991,7 @@ class Menu:
 			"(ctrl+z)" : "Sleep program and put in background.",
 			"(ctrl+c, q)" : "Quits program.",
 			"(+) / (-)" : "Add/Subtract 100ms to/from update timer.",
+			"(d)" : "Toggle frame stats with output size and timings.",
 			"(Up) (Down)" : "Select in process list.",
 			"(Enter)" : "Show detailed information for selected process.",
 			"(Spacebar)" : "Expand/collapse the selected process in tree view.",
@@ -3825,6 +5147,48 @@ class Menu:
 				'',
 				'Min value: 100 ms',
 				'Max value: 86400000 ms = 24 hours.'],
+			"cpu_update_ms" : [
+				'Update time for cpu stats in milliseconds.',
+				'',
+				'Lets the cpu graphs update faster or slower',
+				'than the other boxes.',
+				'',
+				'0 to follow "update_ms".',
+				'Min value: 100 ms'],
+			"proc_update_ms" : [
+				'Update time for processes in milliseconds.',
+				'',
+				'The process scan is the most expensive',
+				'collector, a higher value than "update_ms"',
+				'lowers bpytops own cpu usage on busy hosts.',
+				'',
+				'0 to follow "update_ms".',
+				'Min value: 100 ms'],
+			"net_update_ms" : [
+				'Update time for network stats in milliseconds.',
+				'',
+				'0 to follow "update_ms".',
+				'Min value: 100 ms'],
+			"disk_update_ms" : [
+				'Update time for disks in milliseconds.',
+				'',
+				'Memory is collected together with disks',
+				'at the shortest of "update_ms" and this.',
+				'',
+				'0 to follow "update_ms".',
+				'Min value: 100 ms'],
+			"parallel_collect" : [
+				'Collect data concurrently.',
+				'',
+				'Runs the cpu, memory, network and process',
+				'collectors at the same time in a small thread',
+				'pool, so a slow process scan or disk mount',
+				'doesn\'t delay the cpu and network samples.',
+				'',
+				'Drawing still happens in order after all',
+				'collectors have finished.',
+				'',
+				'True or False.'],
 			"proc_sorting" : [
 				'Processes sorting option.',
 				'',
@@ -3905,6 +5269,18 @@ class Menu:
 				'',
 				'Set this to false if the menus is flickering',
 				'too much for a comfortable experience.'],
+			"diff_render" : [
+				'Only print what changed on screen.',
+				'',
+				'Keeps a grid of every character on screen',
+				'and only prints the characters and colors',
+				'that changed since the last update.',
+				'',
+				'Lowers the output a lot when running over',
+				'slow connections like ssh, at the cost of',
+				'some extra cpu time for each update.',
+				'',
+				'True or False.'],
 			"custom_cpu_name" : [
 				'Custom cpu model name in cpu percentage box.',
 				'',
@@ -4003,12 +5379,24 @@ class Menu:
 				'',
 				'Levels are: "ERROR" "WARNING" "INFO" "DEBUG".',
 				'The level set includes all lower levels,',
-				'i.e. "DEBUG" will show all logging info.']
+				'i.e. "DEBUG" will show all logging info.'],
+			"stats_format" : [
+				'Format for exported collector stats.',
+				'',
+				'"csv" writes text rows to "stats.csv".',
+				'',
+				'"columnar" writes fixed width binary columns',
+				'with a time index to the "stats" directory,',
+				'one sub directory per collector.',
+				'The files are append only and can be memory',
+				'mapped, use the StatsColumnReader class in',
+				'bpytop.py to read a time range.']
 			}
 		option_len: int = len(option_items) * 2
 		sorting_i: int = CONFIG.sorting_options.index(CONFIG.proc_sorting)
 		loglevel_i: int = CONFIG.log_levels.index(CONFIG.log_level)
 		view_mode_i: int = CONFIG.view_modes.index(CONFIG.view_mode)
+		stats_format_i: int = CONFIG.stats_formats.index(CONFIG.stats_format)
 		cpu_sensor_i: int = CONFIG.cpu_sensors.index(CONFIG.cpu_sensor)
 		color_i: int
 		while not cls.close:
@@ -4056,13 +5444,15 @@ class Menu:
 						counter = f' {loglevel_i + 1}/{len(CONFIG.log_levels)}'
 					elif opt == "view_mode":
 						counter = f' {view_mode_i + 1}/{len(CONFIG.view_modes)}'
+					elif opt == "stats_format":
+						counter = f' {stats_format_i + 1}/{len(CONFIG.stats_formats)}'
 					elif opt == "cpu_sensor":
 						counter = f' {cpu_sensor_i + 1}/{len(CONFIG.cpu_sensors)}'
 					else:
 						counter = ""
 					out += f'{Mv.to(y+1+cy, x+1)}{t_color}{Fx.b}{opt.replace("_", " ").capitalize() + counter:^24.24}{Fx.ub}{Mv.to(y+2+cy, x+1)}{v_color}'
 					if opt == selected:
-						if isinstance(value, bool) or opt in ["color_theme", "proc_sorting", "log_level", "view_mode", "cpu_sensor"]:
+						if isinstance(value, bool) or opt in ["color_theme", "proc_sorting", "log_level", "view_mode", "cpu_sensor", "stats_format"]:
 							out += f'{t_color} {Symbol.left}{v_color}{d_quote + str(value) + d_quote:^20.20}{t_color}{Symbol.right} '
 						elif inputting:
 							out += f'{str(input_val)[-17:] + Fx.bl + "█" + Fx.ubl + "" + Symbol.enter:^33.33}'
@@ -4129,6 +5519,11 @@ class Menu:
 									CONFIG.update_ms = 86399900
 								else:
 									CONFIG.update_ms = int(input_val)
+							elif selected.endswith("_update_ms"):
+								if not input_val or int(input_val) == 0:
+									setattr(CONFIG, selected, 0)
+								else:
+									setattr(CONFIG, selected, min(max(int(input_val), 100), 86399900))
 							elif selected == "tree_depth":
 								if not input_val or int(input_val) < 0:
 									CONFIG.tree_depth = 0
@@ -4157,7 +5552,7 @@ class Menu:
 				elif key in ["escape", "o", "M", "f2"]:
 					cls.close = True
 					break
-				elif key == "enter" and selected in ["update_ms", "disks_filter", "custom_cpu_name", "net_download", "net_upload", "draw_clock", "tree_depth"]:
+				elif key == "enter" and selected in ["update_ms", "cpu_update_ms", "proc_update_ms", "net_update_ms", "disk_update_ms", "disks_filter", "custom_cpu_name", "net_download", "net_upload", "draw_clock", "tree_depth"]:
 					inputting = True
 					input_val = str(getattr(CONFIG, selected))
 				elif key == "left" and selected == "update_ms" and CONFIG.update_ms - 100 >= 100:
@@ -4166,6 +5561,10 @@ class Menu:
 				elif key == "right" and selected == "update_ms" and CONFIG.update_ms + 100 <= 86399900:
 					CONFIG.update_ms += 100
 					Box.draw_update_ms()
+				elif key == "left" and selected.endswith("_update_ms") and getattr(CONFIG, selected) > 0:
+					setattr(CONFIG, selected, getattr(CONFIG, selected) - 100 if getattr(CONFIG, selected) - 100 >= 100 else 0)
+				elif key == "right" and selected.endswith("_update_ms") and getattr(CONFIG, selected) + 100 <= 86399900:
+					setattr(CONFIG, selected, getattr(CONFIG, selected) + 100)
 				elif key == "left" and selected == "tree_depth" and CONFIG.tree_depth > 0:
 					CONFIG.tree_depth -= 1
 					ProcCollector.collapsed = {}
@@ -4184,7 +5583,7 @@ class Menu:
 						if selected == "net_auto": NetCollector.auto_min = CONFIG.net_auto
 						NetBox.redraw = True
 					if selected == "theme_background":
-						Term.bg = THEME.main_bg if CONFIG.theme_background else "\033[49m"
+						Term.bg = THEME.main_bg.escape if CONFIG.theme_background else "\033[49m"
 						Draw.now(Term.bg)
 					if selected == "show_battery":
 						Draw.clear("battery", saved=True)
@@ -4227,6 +5626,14 @@ class Menu:
 						CpuCollector.get_sensors()
 						Term.refresh(force=True)
 						cls.resized = False
+				elif key in ["left", "right"] and selected == "stats_format":
+					if key == "left":
+						stats_format_i -= 1
+						if stats_format_i < 0: stats_format_i = len(CONFIG.stats_formats) - 1
+					elif key == "right":
+						stats_format_i += 1
+						if stats_format_i > len(CONFIG.stats_formats) - 1: stats_format_i = 0
+					CONFIG.stats_format = CONFIG.stats_formats[stats_format_i]
 				elif key in ["left", "right"] and selected == "view_mode":
 					if key == "left":
 						view_mode_i -= 1
@@ -4292,19 +5699,19 @@ class Timer:
 		if cls.return_zero:
 			cls.return_zero = False
 			return False
-		if cls.timestamp + (CONFIG.update_ms / 1000) > time():
+		if cls.timestamp + Collector.tick() > time():
 			return True
 		else:
 			return False
 
 	@classmethod
 	def left(cls) -> float:
-		return cls.timestamp + (CONFIG.update_ms / 1000) - time()
+		return cls.timestamp + Collector.tick() - time()
 
 	@classmethod
 	def finish(cls):
 		cls.return_zero = True
-		cls.timestamp = time() - (CONFIG.update_ms / 1000)
+		cls.timestamp = time() - Collector.tick()
 		Key.break_wait()
 
 class UpdateChecker:
@@ -4516,9 +5923,11 @@ def clean_quit(errcode: int = 0, errmsg: str = "", thread: bool = False):
 	if THREAD_ERROR: errcode = THREAD_ERROR
 	Key.stop()
 	Collector.stop()
+	Stats.stop()
 	if not errcode: CONFIG.save_config()
-	Draw.now(Term.clear, Term.normal_screen, Term.show_cursor, Term.mouse_off, Term.mouse_direct_off, Term.title())
-	Term.echo(True)
+	if not HEADLESS:
+		Draw.now(Term.clear, Term.normal_screen, Term.show_cursor, Term.mouse_off, Term.mouse_direct_off, Term.title())
+		Term.echo(True)
 	if errcode == 0:
 		errlog.info(f'Exiting. Runtime {timedelta(seconds=round(time() - SELF_START, 0))} \n')
 	else:
@@ -4672,6 +6081,13 @@ def process_keys():
 			Menu.options()
 		elif key in ["h", "f1"]:
 			Menu.help()
+		elif key == "d":
+			FrameStats.overlay = not FrameStats.overlay
+			if FrameStats.overlay:
+				Collector.collect(only_draw=True)
+			else:
+				Draw.clear("frame_stats", saved=True)
+				Term.refresh(force=True)
 		elif key == "z":
 			NetCollector.reset = not NetCollector.reset
 			Collector.collect(NetCollector, redraw=True)
@@ -4749,8 +6165,8 @@ def process_keys():
 			else:
 				continue
 			ProcCollector.details = {}
-			ProcCollector.details_cpu = []
-			ProcCollector.details_mem = []
+			ProcCollector.details_cpu = RingBuffer(ProcBox.width, "I")
+			ProcCollector.details_mem = RingBuffer(ProcBox.width, "I")
 			Graphs.detailed_cpu = NotImplemented
 			Graphs.detailed_mem = NotImplemented
 			Collector.collect(ProcCollector, proc_interrupt=True, redraw=True)
@@ -4766,9 +6182,36 @@ CPU_NAME: str = get_cpu_name()
 
 THEME: Theme
 
+def headless():
+	"""Run the collectors on the update_ms schedule without touching the terminal, samples only go to the stats export"""
+	errlog.info(f'Running headless, writing stats every {CONFIG.update_ms} ms')
+	try:
+		if CONFIG.check_temp: CpuCollector.get_sensors()
+		signal.signal(signal.SIGINT, quit_sigint)
+		signal.signal(signal.SIGTERM, quit_sigint)
+		Stats.start()
+		Collector.start()
+	except Exception as e:
+		errlog.exception(f'{e}')
+		clean_quit(1, errmsg=f'Bpytop failed to start headless: {e}')
+
+	try:
+		while True:
+			Timer.stamp()
+			Collector.collect(draw_now=False)
+			while Timer.not_zero():
+				sleep(max(Timer.left(), 0))
+	except Exception as e:
+		errlog.exception(f'{e}')
+		clean_quit(1)
+
 def main():
 	global THEME
 
+	if HEADLESS:
+		headless()
+		return
+
 	Term.width = os.get_terminal_size().columns
 	Term.height = os.get_terminal_size().lines
 
@@ -4836,6 +6279,7 @@ def main():
 	if CONFIG.show_init:
 		Draw.buffer("+init!", f'{Mv.restore}{Fx.trans("Starting data collection and drawer thread... ")}{Mv.save}')
 	try:
+		Stats.start()
 		Collector.start()
 	except Exception as e:
 		Init.fail(e)
@@ -0,0 +1,44 @@
+import random
+import sys
+
+sys.argv = sys.argv[:1] #* bpytop parses the command line on import
+import bpytop
+
+
+def recount(parents, values):
+	'''Subtree totals counted from scratch, missing parents get the totals of their children like in the index'''
+	totals = {}
+	for pid, own in values.items():
+		while True:
+			sums = totals.setdefault(pid, [0, 0.0, 0, 0.0, 0])
+			for i, value in enumerate(own):
+				sums[i] += value
+			ppid = parents.get(pid)
+			if ppid is None or ppid == pid: break
+			pid = ppid
+	return totals
+
+
+def test_tree_index_matches_recount_with_stale_parents():
+	proc = bpytop.ProcCollector
+	proc.tree_parent, proc.tree_children, proc.tree_values, proc.tree_totals = {}, {}, {}, {}
+	proc.tree_counter = 0
+	rnd = random.Random(1)
+	parents = {1 : 0, 2 : 0}
+	for _ in range(500):
+		live = list(parents)
+		for pid in rnd.sample(live, min(len(live) // 5, 3)):
+			if pid > 2: del parents[pid]
+		for _ in range(rnd.randint(0, 4)):
+			pid = max(live) + 1
+			parents[pid] = rnd.choice(live) #* Parent may have died in this snapshot, like a ppid read before the parent exited
+			live.append(pid)
+		for pid in rnd.sample(list(parents), 2):
+			if pid > 2 and rnd.random() < 0.3: parents[pid] = 1
+		values = { pid : (rnd.randint(1, 8), rnd.random(), rnd.randint(0, 1000), rnd.random(), 1) for pid in parents }
+		proc._tree_index(parents, values)
+		expected = recount(parents, values)
+		for pid in parents:
+			assert proc.tree_totals[pid][0] == expected[pid][0]
+			assert proc.tree_totals[pid][4] == expected[pid][4]
+			assert abs(proc.tree_totals[pid][1] - expected[pid][1]) < 1e-6
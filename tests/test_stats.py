@@ -0,0 +1,35 @@
+import sys
+
+sys.argv = sys.argv[:1] #* bpytop parses the command line on import
+import bpytop
+
+
+def test_decreasing_timestamp_is_clamped(tmp_path):
+	path = str(tmp_path / "stats")
+	writer = bpytop.StatsColumnWriter(path)
+	writer.write([(3_000_000_000, "cpu", { "load" : 1 }), (5_000_000_000, "cpu", { "load" : 2 })])
+	writer.write([(4_000_000_000, "cpu", { "load" : 3 }), (6_000_000_000, "cpu", { "load" : 4 })])
+	writer.close()
+
+	reader = bpytop.StatsColumnReader(path)
+	assert list(reader.slice("cpu")["time"]) == [3_000_000_000, 5_000_000_000, 5_000_000_000, 6_000_000_000]
+	out = reader.slice("cpu", 4, 6)
+	assert list(out["load"]) == [2, 3]
+	assert list(reader.slice("cpu", 6)["load"]) == [4]
+	del out
+	reader.close()
+
+
+def test_clamp_continues_after_reopen(tmp_path):
+	path = str(tmp_path / "stats")
+	writer = bpytop.StatsColumnWriter(path)
+	writer.write([(5_000_000_000, "cpu", { "load" : 1 })])
+	writer.close()
+	writer = bpytop.StatsColumnWriter(path)
+	writer.write([(2_000_000_000, "cpu", { "load" : 2 })])
+	writer.close()
+
+	reader = bpytop.StatsColumnReader(path)
+	assert list(reader.slice("cpu")["time"]) == [5_000_000_000, 5_000_000_000]
+	assert list(reader.slice("cpu", 5)["load"]) == [1, 2]
+	reader.close()